@@ -25,16 +25,23 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
 INTRO_TEXT = 'Resumos do grupo "Aprendizados IA + Educação"'
 
+# Caracteres do início do arquivo onde a introdução é procurada
+# (cobre com folga as primeiras linhas)
+INTRO_HEAD_CHARS = 512
+
 # Captura duas datas ISO (YYYY-MM-DD) em qualquer posição do nome
 FILENAME_DATES = re.compile(r"(\d{4}-\d{2}-\d{2}).*?(\d{4}-\d{2}-\d{2})")
 
 
+@lru_cache(maxsize=256)
 def iso_to_br(iso_date: str) -> str:
     """Converte 'YYYY-MM-DD' → 'DD/MM/YYYY'."""
     try:
@@ -63,9 +70,8 @@ def build_intro(start_iso: str, end_iso: str, style: str) -> str:
 
 
 def detect_intro(text: str) -> bool:
-    """Retorna True se o texto já possui a introdução nas primeiras linhas."""
-    head = "\n".join(text.splitlines()[:5])
-    return INTRO_TEXT in head
+    """Retorna True se o texto já possui a introdução no início do arquivo."""
+    return INTRO_TEXT in text[:INTRO_HEAD_CHARS]
 
 
 def extract_dates_from_name(path: Path) -> tuple[str, str] | None:
@@ -130,8 +136,31 @@ def process_file(path: Path, *, in_place: bool, style: str, force: bool) -> int:
     return 0
 
 
+def _process_one(path: Path, *, style: str, force: bool) -> str | None:
+    """Reescreve um arquivo do diretório; retorna mensagem de aviso, se houver."""
+    try:
+        if not extract_dates_from_name(path):
+            raise ValueError(f"não foi possível extrair datas do nome: {path.name}")
+        with path.open(encoding="utf-8") as f:
+            head = f.read(INTRO_HEAD_CHARS)
+            # Já tem introdução: nada a fazer, sem ler o resto do arquivo
+            if not force and detect_intro(head):
+                return None
+            content = head + f.read()
+        new_content = process_text_for_file(content, path, style=style, force=force)
+        if new_content != content:
+            path.write_text(new_content, encoding="utf-8")
+    except ValueError as e:
+        return f"{path.name}: {e}"
+    return None
+
+
 def process_dir(root: Path, *, style: str, force: bool) -> int:
-    """Processa todos os .md do diretório recursivamente (in-place)."""
+    """Processa todos os .md do diretório recursivamente (in-place).
+
+    Os arquivos são lidos e reescritos em paralelo por threads, já que o
+    custo é dominado por I/O de disco.
+    """
     if not root.exists():
         print(f"Erro: diretório não encontrado: {root}", file=sys.stderr)
         return 2
@@ -140,15 +169,12 @@ def process_dir(root: Path, *, style: str, force: bool) -> int:
         return 1
 
     rc = 0
-    for path in sorted(root.rglob("*.md")):
-        try:
-            content = path.read_text(encoding="utf-8")
-            new_content = process_text_for_file(content, path, style=style, force=force)
-            if new_content != content:
-                path.write_text(new_content, encoding="utf-8")
-        except ValueError as e:
-            print(f"Aviso: {path.name}: {e}", file=sys.stderr)
-            rc = 1
+    paths = sorted(root.rglob("*.md"))
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for warning in ex.map(lambda p: _process_one(p, style=style, force=force), paths):
+            if warning:
+                print(f"Aviso: {warning}", file=sys.stderr)
+                rc = 1
     return rc
 
 
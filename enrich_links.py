@@ -2,106 +2,138 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
+#     "orjson",
 #     "playwright",
 # ]
 # ///
 """Enriquece links com títulos e descrições extraídos via browser headless."""
 
 import argparse
+import asyncio
 import json
+import os
 import sys
 import time
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
 
-def extract_metadata(page) -> dict:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj, *, indent: bool = False) -> bytes:
+    """Serializa em JSON UTF-8, usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    # Mesmo formato do orjson: compacto, ou indentado com 2 espaços
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(data: bytes | str):
+    """Desserializa JSON, usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Verdadeiro quando já há metadados úteis ou o carregamento terminou
+META_READY_JS = """() => document.querySelector('meta[property="og:title"]')
+  || document.querySelector('meta[name="description"]')
+  || document.readyState === 'complete'"""
+
+
+# Lê todas as meta tags relevantes em uma única ida ao browser
+META_JS = """() => {
+  const g = s => document.querySelector(s)?.content;
+  return {
+    og_title: g('meta[property="og:title"]'),
+    twitter_title: g('meta[name="twitter:title"]'),
+    title: document.title,
+    og_description: g('meta[property="og:description"]'),
+    description: g('meta[name="description"]'),
+    twitter_description: g('meta[name="twitter:description"]'),
+  };
+}"""
+
+
+def first_value(data: dict, *keys: str) -> str | None:
+    """Retorna o primeiro valor não vazio entre as chaves, já sem espaços."""
+    for key in keys:
+        value = (data.get(key) or '').strip()
+        if value:
+            return value
+    return None
+
+
+async def extract_metadata(page) -> dict:
     """Extrai título e descrição da página carregada."""
+    data = await page.evaluate(META_JS)
     metadata = {}
 
-    # Título: tenta várias fontes
-    try:
-        # 1. og:title (melhor para compartilhamento)
-        og_title = page.locator('meta[property="og:title"]').get_attribute('content', timeout=1000)
-        if og_title:
-            metadata['title'] = og_title.strip()
-    except Exception:
-        pass
-
-    if 'title' not in metadata:
-        try:
-            # 2. twitter:title
-            tw_title = page.locator('meta[name="twitter:title"]').get_attribute('content', timeout=1000)
-            if tw_title:
-                metadata['title'] = tw_title.strip()
-        except Exception:
-            pass
+    # Título: og:title > twitter:title > <title>
+    title = first_value(data, 'og_title', 'twitter_title', 'title')
+    if title:
+        metadata['title'] = title
 
-    if 'title' not in metadata:
-        try:
-            # 3. <title> tag
-            title = page.title()
-            if title:
-                metadata['title'] = title.strip()
-        except Exception:
-            pass
+    # Descrição: og:description > meta description > twitter:description
+    description = first_value(data, 'og_description', 'description', 'twitter_description')
+    if description:
+        metadata['description'] = description[:500]
 
-    # Descrição: tenta várias fontes
-    try:
-        # 1. og:description
-        og_desc = page.locator('meta[property="og:description"]').get_attribute('content', timeout=1000)
-        if og_desc:
-            metadata['description'] = og_desc.strip()[:500]
-    except Exception:
-        pass
-
-    if 'description' not in metadata:
-        try:
-            # 2. meta description
-            meta_desc = page.locator('meta[name="description"]').get_attribute('content', timeout=1000)
-            if meta_desc:
-                metadata['description'] = meta_desc.strip()[:500]
-        except Exception:
-            pass
+    return metadata
 
-    if 'description' not in metadata:
-        try:
-            # 3. twitter:description
-            tw_desc = page.locator('meta[name="twitter:description"]').get_attribute('content', timeout=1000)
-            if tw_desc:
-                metadata['description'] = tw_desc.strip()[:500]
-        except Exception:
-            pass
 
-    return metadata
+# Recursos desnecessários para extrair metadados
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+BLOCKED_URL_MARKERS = ('analytics', 'tracking', 'doubleclick')
 
 
-def enrich_link(browser, link: dict, timeout: int = 15000) -> dict:
-    """Visita um link e extrai metadados."""
-    url = link['url']
-    result = link.copy()
+async def block_heavy_requests(route) -> None:
+    """Aborta requisições de recursos pesados ou de rastreamento."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        marker in request.url for marker in BLOCKED_URL_MARKERS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
 
-    context = browser.new_context(
+
+async def create_context(browser):
+    """Cria o contexto do browser compartilhado entre todos os links."""
+    context = await browser.new_context(
         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         viewport={'width': 1280, 'height': 720},
         locale='pt-BR',
     )
 
-    try:
-        page = context.new_page()
+    # Bloqueia recursos pesados e rastreadores para acelerar
+    await context.route('**/*', block_heavy_requests)
+
+    return context
 
-        # Bloqueia recursos pesados para acelerar
-        page.route('**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,eot}', lambda route: route.abort())
-        page.route('**/*analytics*', lambda route: route.abort())
-        page.route('**/*tracking*', lambda route: route.abort())
 
-        page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+async def enrich_link(page, link: dict, timeout: int = 15000) -> dict:
+    """Visita um link com uma página reutilizável e extrai metadados."""
+    url = link['url']
+    result = link.copy()
+
+    try:
+        await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
 
-        # Espera um pouco para JS carregar
-        page.wait_for_timeout(2000)
+        # Espera (no máximo 2s) as meta tags aparecerem ou a página terminar de carregar
+        try:
+            await page.wait_for_function(META_READY_JS, timeout=2000)
+        except PlaywrightTimeout:
+            pass
 
-        metadata = extract_metadata(page)
+        metadata = await extract_metadata(page)
 
         if metadata.get('title'):
             result['title'] = metadata['title']
@@ -119,12 +151,113 @@ def enrich_link(browser, link: dict, timeout: int = 15000) -> dict:
     except Exception as e:
         result['enriched'] = False
         result['enrich_status'] = f'error: {str(e)[:100]}'
-    finally:
-        context.close()
+
+    if not result['enriched']:
+        # Descarta o que sobrou da página que falhou antes do próximo link
+        try:
+            await page.goto('about:blank')
+        except Exception:
+            pass
 
     return result
 
 
+def save_links(links: list[dict], output_path: Path) -> None:
+    """Grava a lista completa de links em JSON (escrita atômica)."""
+    tmp_path = output_path.with_suffix('.tmp')
+    tmp_path.write_bytes(dumps_json(links, indent=True))
+    os.replace(tmp_path, output_path)
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    """Caminho do checkpoint JSONL associado ao arquivo de saída."""
+    return output_path.with_suffix('.jsonl.part')
+
+
+def load_checkpoint(links: list[dict], part_path: Path) -> int:
+    """Reaplica em `links` os resultados de uma execução interrompida.
+
+    Returns:
+        Número de links restaurados do checkpoint.
+    """
+    if not part_path.exists():
+        return 0
+
+    by_url = {link['url']: i for i, link in enumerate(links)}
+    restored = 0
+    with part_path.open('rb') as f:
+        for line in f:
+            try:
+                enriched = loads_json(line)
+            except ValueError:
+                continue  # última linha pode ter sido truncada
+            i = by_url.get(enriched.get('url'))
+            if i is not None:
+                links[i] = enriched
+                restored += 1
+    return restored
+
+
+async def enrich_links(
+    links: list[dict],
+    indices: list[int],
+    output_path: Path,
+    *,
+    concurrency: int = 4,
+    timeout: int = 15000,
+) -> int:
+    """Enriquece os links indicados em paralelo com `concurrency` páginas.
+
+    Atualiza `links` in-place e registra cada resultado no checkpoint
+    JSONL ao lado de `output_path`.
+
+    Returns:
+        Número de links processados.
+    """
+    total = len(links)
+
+    async with async_playwright() as p, checkpoint_path(output_path).open('ab') as part:
+        browser = await p.chromium.launch(headless=True)
+        context = await create_context(browser)
+
+        # Pool de páginas reutilizadas entre links; limita a concorrência
+        pages: asyncio.Queue = asyncio.Queue()
+        for _ in range(concurrency):
+            pages.put_nowait(await context.new_page())
+
+        async def bounded(i: int) -> tuple[int, dict, float]:
+            page = await pages.get()
+            try:
+                print(f"[{i+1}/{total}] Processando: {links[i]['url'][:80]}...", file=sys.stderr)
+                start_time = time.time()
+                enriched = await enrich_link(page, links[i], timeout=timeout)
+                return i, enriched, time.time() - start_time
+            finally:
+                if page.is_closed():
+                    page = await context.new_page()
+                pages.put_nowait(page)
+
+        processed = 0
+        for coro in asyncio.as_completed([bounded(i) for i in indices]):
+            i, enriched, elapsed = await coro
+            links[i] = enriched
+
+            status = enriched.get('enrich_status', 'unknown')
+            title_preview = enriched.get('title', 'N/A')[:50]
+            print(f"[{i+1}/{total}] Status: {status} | Título: {title_preview}... ({elapsed:.1f}s)", file=sys.stderr)
+
+            processed += 1
+
+            # Checkpoint: custo constante por link, ao contrário de regravar o JSON inteiro
+            part.write(dumps_json(enriched) + b'\n')
+            part.flush()
+
+        await context.close()
+        await browser.close()
+
+    return processed
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -159,14 +292,24 @@ def main() -> int:
         action='store_true',
         help='Pula links já enriquecidos',
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Número de páginas abertas em paralelo (default: 4)',
+    )
     args = parser.parse_args()
 
     if not args.input_file.exists():
         print(f"Erro: arquivo não encontrado: {args.input_file}", file=sys.stderr)
         return 2
 
+    if args.concurrency < 1:
+        print(f"Erro: --concurrency deve ser pelo menos 1 (recebido: {args.concurrency})", file=sys.stderr)
+        return 2
+
     # Carrega links
-    links = json.loads(args.input_file.read_text(encoding='utf-8'))
+    links = loads_json(args.input_file.read_bytes())
     total = len(links)
     output_path = args.output or args.input_file
 
@@ -175,49 +318,31 @@ def main() -> int:
     print(f"Salvando em: {output_path}", file=sys.stderr)
     print("-" * 50, file=sys.stderr)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-
-        processed = 0
-        end_idx = args.start + args.limit if args.limit else total
-
-        for i in range(args.start, min(end_idx, total)):
-            link = links[i]
-
-            # Pula se já enriquecido
-            if args.skip_enriched and link.get('enriched'):
-                print(f"[{i+1}/{total}] SKIP (já enriquecido): {link['domain']}", file=sys.stderr)
-                continue
-
-            print(f"[{i+1}/{total}] Processando: {link['url'][:80]}...", file=sys.stderr)
-
-            start_time = time.time()
-            enriched = enrich_link(browser, link, timeout=args.timeout)
-            elapsed = time.time() - start_time
-
-            links[i] = enriched
-
-            status = enriched.get('enrich_status', 'unknown')
-            title_preview = enriched.get('title', 'N/A')[:50]
-            print(f"         Status: {status} | Título: {title_preview}... ({elapsed:.1f}s)", file=sys.stderr)
-
-            processed += 1
-
-            # Salva progresso a cada 10 links
-            if processed % 10 == 0:
-                output_path.write_text(
-                    json.dumps(links, ensure_ascii=False, indent=2),
-                    encoding='utf-8'
-                )
-                print(f"         [Progresso salvo: {processed} links processados]", file=sys.stderr)
-
-        browser.close()
+    part_path = checkpoint_path(output_path)
+    restored = load_checkpoint(links, part_path)
+    if restored:
+        print(f"Restaurados do checkpoint: {restored} links ({part_path})", file=sys.stderr)
+
+    end_idx = min(args.start + args.limit if args.limit else total, total)
+    indices = []
+    for i in range(args.start, end_idx):
+        # Pula se já enriquecido
+        if args.skip_enriched and links[i].get('enriched'):
+            print(f"[{i+1}/{total}] SKIP (já enriquecido): {links[i]['domain']}", file=sys.stderr)
+            continue
+        indices.append(i)
+
+    processed = asyncio.run(enrich_links(
+        links,
+        indices,
+        output_path,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+    ))
 
     # Salva final
-    output_path.write_text(
-        json.dumps(links, ensure_ascii=False, indent=2),
-        encoding='utf-8'
-    )
+    save_links(links, output_path)
+    part_path.unlink(missing_ok=True)
 
     # Estatísticas
     success = sum(1 for l in links if l.get('enrich_status') == 'success')
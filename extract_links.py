@@ -2,7 +2,8 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
-#     "httpx",
+#     "httpx[http2]",
+#     "orjson",
 #     "tqdm",
 # ]
 # ///
@@ -13,25 +14,52 @@ import asyncio
 import json
 import re
 import sys
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
 from tqdm import tqdm
 
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj, *, indent: bool = False) -> bytes:
+    """Serializa em JSON UTF-8, usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    # Mesmo formato do orjson: compacto, ou indentado com 2 espaços
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads_json(data: bytes | str):
+    """Desserializa JSON, usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Regex para extrair URLs
 URL_PATTERN = re.compile(r'https?://[^\s<>"\')\]]+')
 
 # Regex para extrair contexto da mensagem WhatsApp
 # Formato: DD/MM/YYYY HH:MM da manhã/tarde/noite/madrugada - Nome: Mensagem
+# Aplicada linha a linha; quantificadores possessivos e grupos atômicos
+# evitam backtracking em linhas longas ou com ':' no nome.
 MESSAGE_PATTERN = re.compile(
-    r'^(\d{2}/\d{2}/\d{4})\s+\d{1,2}:\d{2}\s+da\s+(?:manhã|tarde|noite|madrugada)\s+-\s+([^:]+):\s*(.+)$',
-    re.MULTILINE
+    r'(\d{2}/\d{2}/\d{4})[^\S\n]++\d{1,2}:\d{2}[^\S\n]++da[^\S\n]++(?>manhã|tarde|noite|madrugada)'
+    r'[^\S\n]++-[^\S\n]++([^:\n]++):[^\S\n]*(.+)$'
 )
 
-# Parâmetros de tracking a remover
-TRACKING_PARAMS = {
+# Parâmetros de tracking a remover (em minúsculas: a busca usa a chave normalizada)
+TRACKING_PARAMS = frozenset({
     # UTM parameters
     'utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term',
     # Facebook/Meta
@@ -43,40 +71,52 @@ TRACKING_PARAMS = {
     # LinkedIn
     'trk', 'lipi', 'licu',
     # Amazon
-    'tag', 'linkCode', 'linkId',
+    'tag', 'linkcode', 'linkid',
     # Outros
     'share', 'si',  # Spotify
-}
+})
 
 # Parâmetros essenciais a preservar (por domínio)
 ESSENTIAL_PARAMS = {
-    'youtube.com': {'v', 't', 'list', 'index'},
-    'youtu.be': {'t'},
-    'twitter.com': {'s'},
-    'x.com': {'s'},
-    'open.spotify.com': {},  # path contém ID
-    'docs.google.com': {},  # path contém ID
-    'linkedin.com': {},
+    'youtube.com': frozenset({'v', 't', 'list', 'index'}),
+    'youtu.be': frozenset({'t'}),
+    'twitter.com': frozenset({'s'}),
+    'x.com': frozenset({'s'}),
+    'open.spotify.com': frozenset(),  # path contém ID
+    'docs.google.com': frozenset(),  # path contém ID
+    'linkedin.com': frozenset(),
 }
 
+# Sufixos ordenados do mais longo para o mais curto: o mais específico vence
+ESSENTIAL_SUFFIXES = sorted(ESSENTIAL_PARAMS.items(), key=lambda kv: -len(kv[0]))
 
+
+def essential_params(domain: str) -> frozenset[str]:
+    """Parâmetros essenciais do domínio ou de um domínio pai (ex.: m.youtube.com)."""
+    return next(
+        (params for suffix, params in ESSENTIAL_SUFFIXES
+         if domain == suffix or domain.endswith('.' + suffix)),
+        frozenset(),
+    )
+
+
+@lru_cache(maxsize=None)
 def clean_url(url: str) -> str:
     """Remove parâmetros de tracking da URL, preservando parâmetros essenciais."""
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         domain = parsed.netloc.replace('www.', '').lower()
 
         # Obtém parâmetros essenciais para o domínio
-        essential = ESSENTIAL_PARAMS.get(domain, set())
+        essential = essential_params(domain)
 
         # Filtra query params
         if parsed.query:
-            params = parse_qs(parsed.query, keep_blank_values=True)
-            filtered_params = {
-                k: v for k, v in params.items()
-                if k.lower() not in TRACKING_PARAMS or k.lower() in essential
-            }
-            new_query = urlencode(filtered_params, doseq=True) if filtered_params else ''
+            filtered_params = [
+                (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                if (key := k.lower()) not in TRACKING_PARAMS or key in essential
+            ]
+            new_query = urlencode(filtered_params) if filtered_params else ''
         else:
             new_query = ''
 
@@ -84,11 +124,10 @@ def clean_url(url: str) -> str:
         fragment = parsed.fragment if parsed.fragment and not parsed.fragment.startswith('~') else ''
 
         # Reconstrói URL limpa
-        clean = urlunparse((
+        clean = urlunsplit((
             parsed.scheme,
             parsed.netloc,
             parsed.path.rstrip('/') if parsed.path != '/' else parsed.path,
-            parsed.params,
             new_query,
             fragment
         ))
@@ -98,87 +137,126 @@ def clean_url(url: str) -> str:
         return url
 
 
+@lru_cache(maxsize=None)
 def extract_domain(url: str) -> str:
     """Extrai o domínio principal da URL."""
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         domain = parsed.netloc.replace('www.', '').lower()
         return domain
     except Exception:
         return 'unknown'
 
 
+def _title_linkedin(path: str) -> str | None:
+    if '/in/' in path:
+        # Perfil do LinkedIn
+        name = path.split('/in/')[-1].split('/')[0]
+        name = name.replace('-', ' ').title()
+        return f"LinkedIn - {name}"
+    elif '/posts/' in path or '/feed/' in path:
+        return "LinkedIn - Post"
+    elif '/company/' in path:
+        company = path.split('/company/')[-1].split('/')[0]
+        return f"LinkedIn - {company.replace('-', ' ').title()}"
+    return None
+
+
+def _title_youtube(path: str) -> str:
+    return "YouTube - Vídeo"
+
+
+def _title_instagram(path: str) -> str:
+    if path:
+        username = path.split('/')[0]
+        return f"Instagram - @{username}"
+    return "Instagram"
+
+
+def _title_twitter(path: str) -> str:
+    if path:
+        username = path.split('/')[0]
+        return f"X/Twitter - @{username}"
+    return "X/Twitter"
+
+
+def _title_google_docs(path: str) -> str:
+    if '/document/' in path:
+        return "Google Docs - Documento"
+    elif '/spreadsheets/' in path:
+        return "Google Sheets - Planilha"
+    elif '/presentation/' in path:
+        return "Google Slides - Apresentação"
+    return "Google Docs"
+
+
+def _title_spotify(path: str) -> str:
+    if '/episode/' in path:
+        return "Spotify - Podcast"
+    elif '/track/' in path:
+        return "Spotify - Música"
+    elif '/playlist/' in path:
+        return "Spotify - Playlist"
+    return "Spotify"
+
+
+def _title_github(path: str) -> str:
+    parts = path.split('/')
+    if len(parts) >= 2:
+        return f"GitHub - {parts[0]}/{parts[1]}"
+    return "GitHub"
+
+
+def _title_medium(path: str) -> str:
+    return "Medium - Artigo"
+
+
+def _title_amazon(path: str) -> str:
+    return "Amazon - Produto"
+
+
+# Casos especiais por domínio (casa o domínio ou qualquer subdomínio).
+# Um handler que retorna None cai no título genérico.
+DOMAIN_TITLES = {
+    'linkedin.com': _title_linkedin,
+    'youtube.com': _title_youtube,
+    'youtu.be': _title_youtube,
+    'instagram.com': _title_instagram,
+    'twitter.com': _title_twitter,
+    'x.com': _title_twitter,
+    'docs.google.com': _title_google_docs,
+    'open.spotify.com': _title_spotify,
+    'github.com': _title_github,
+    'medium.com': _title_medium,
+    'amazon.com': _title_amazon,
+    'amazon.com.br': _title_amazon,
+}
+
+SLUG_EXT_PATTERN = re.compile(r'\.[a-z]+$')
+SLUG_SEP_PATTERN = re.compile(r'[-_]')
+
+
+@lru_cache(maxsize=None)
 def generate_title(url: str, domain: str) -> str:
     """Gera um título legível a partir da URL."""
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         path = parsed.path.strip('/')
 
-        # Casos especiais por domínio
-        if 'linkedin.com' in domain:
-            if '/in/' in path:
-                # Perfil do LinkedIn
-                name = path.split('/in/')[-1].split('/')[0]
-                name = name.replace('-', ' ').title()
-                return f"LinkedIn - {name}"
-            elif '/posts/' in path or '/feed/' in path:
-                return "LinkedIn - Post"
-            elif '/company/' in path:
-                company = path.split('/company/')[-1].split('/')[0]
-                return f"LinkedIn - {company.replace('-', ' ').title()}"
-
-        if 'youtube.com' in domain or 'youtu.be' in domain:
-            return "YouTube - Vídeo"
-
-        if 'instagram.com' in domain:
-            if path:
-                username = path.split('/')[0]
-                return f"Instagram - @{username}"
-            return "Instagram"
-
-        if 'twitter.com' in domain or 'x.com' in domain:
-            if path:
-                username = path.split('/')[0]
-                return f"X/Twitter - @{username}"
-            return "X/Twitter"
-
-        if 'docs.google.com' in domain:
-            if '/document/' in path:
-                return "Google Docs - Documento"
-            elif '/spreadsheets/' in path:
-                return "Google Sheets - Planilha"
-            elif '/presentation/' in path:
-                return "Google Slides - Apresentação"
-            return "Google Docs"
-
-        if 'open.spotify.com' in domain:
-            if '/episode/' in path:
-                return "Spotify - Podcast"
-            elif '/track/' in path:
-                return "Spotify - Música"
-            elif '/playlist/' in path:
-                return "Spotify - Playlist"
-            return "Spotify"
-
-        if 'github.com' in domain:
-            parts = path.split('/')
-            if len(parts) >= 2:
-                return f"GitHub - {parts[0]}/{parts[1]}"
-            return "GitHub"
-
-        if 'medium.com' in domain:
-            return "Medium - Artigo"
-
-        if 'amazon.com' in domain or 'amazon.com.br' in domain:
-            return "Amazon - Produto"
+        for suffix, handler in DOMAIN_TITLES.items():
+            if domain == suffix or domain.endswith('.' + suffix):
+                title = handler(path)
+                if title:
+                    return title
+                break
 
         # Genérico: usa o domínio e parte do path
         if path:
             slug = path.split('/')[-1]
             # Remove extensões
-            slug = re.sub(r'\.[a-z]+$', '', slug)
+            slug = SLUG_EXT_PATTERN.sub('', slug)
             # Converte para título legível
-            slug = re.sub(r'[-_]', ' ', slug)
+            slug = SLUG_SEP_PATTERN.sub(' ', slug)
             if len(slug) > 5 and len(slug) < 80:
                 domain_name = domain.split('.')[0].title()
                 return f"{domain_name} - {slug[:60]}"
@@ -188,126 +266,139 @@ def generate_title(url: str, domain: str) -> str:
         return domain
 
 
-def parse_whatsapp_export(text: str) -> Iterator[dict]:
-    """Extrai mensagens com URLs do texto exportado do WhatsApp."""
+def parse_whatsapp_export(lines: Iterable[str]) -> Iterator[dict]:
+    """Extrai mensagens com URLs das linhas exportadas do WhatsApp.
+
+    Consome as linhas sob demanda (ex.: um arquivo aberto), mantendo em
+    memória apenas a linha atual.
+    """
     current_date = None
     current_sender = None
-    current_message = []
 
-    for line in text.split('\n'):
+    for line in lines:
         # Tenta extrair nova mensagem
         match = MESSAGE_PATTERN.match(line)
         if match:
-            # Processa mensagem anterior se houver URLs
-            if current_message:
-                full_message = '\n'.join(current_message)
-                for url in URL_PATTERN.findall(full_message):
-                    yield {
-                        'url_original': url,
-                        'date': current_date,
-                        'shared_by': current_sender,
-                    }
-
-            # Nova mensagem
             current_date = match.group(1)
             current_sender = match.group(2).strip()
-            current_message = [match.group(3)]
+            body_start = match.start(3)
         else:
             # Continuação da mensagem anterior
-            if line.strip():
-                current_message.append(line)
+            body_start = 0
 
-    # Processa última mensagem
-    if current_message:
-        full_message = '\n'.join(current_message)
-        for url in URL_PATTERN.findall(full_message):
+        for url in URL_PATTERN.finditer(line, body_start):
             yield {
-                'url_original': url,
+                'url_original': url.group(),
                 'date': current_date,
                 'shared_by': current_sender,
             }
 
 
-async def validate_url(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> dict:
-    """Valida uma URL via HEAD request."""
+async def validate_url(
+    client: httpx.AsyncClient,
+    idx: int,
+    url: str,
+    semaphore: asyncio.Semaphore,
+) -> tuple[int, dict]:
+    """Valida uma URL via HEAD request (GET sem corpo se o servidor recusar HEAD).
+
+    Retorna o índice recebido junto do resultado, para que o chamador
+    associe a resposta ao link certo mesmo fora de ordem.
+    """
     async with semaphore:
         try:
-            response = await client.head(url, follow_redirects=True, timeout=10.0)
-            return {
+            response = await client.head(url)
+            if response.status_code in (405, 501):
+                # Muitos CDNs rejeitam HEAD: lê só os cabeçalhos do GET
+                async with client.stream('GET', url) as response:
+                    pass
+            return idx, {
                 'status': 'valid' if response.status_code < 400 else 'invalid',
                 'status_code': response.status_code,
                 'final_url': str(response.url) if response.url != url else None,
             }
         except httpx.TimeoutException:
-            return {'status': 'timeout', 'status_code': None, 'final_url': None}
+            return idx, {'status': 'timeout', 'status_code': None, 'final_url': None}
         except httpx.RequestError:
-            return {'status': 'error', 'status_code': None, 'final_url': None}
+            return idx, {'status': 'error', 'status_code': None, 'final_url': None}
         except Exception:
-            return {'status': 'error', 'status_code': None, 'final_url': None}
+            return idx, {'status': 'error', 'status_code': None, 'final_url': None}
 
 
 async def validate_urls(links: list[dict], concurrency: int = 10) -> list[dict]:
-    """Valida múltiplas URLs em paralelo."""
+    """Valida múltiplas URLs em paralelo.
+
+    Usa HTTP/2 e um pool de conexões dimensionado pela concorrência, para
+    reaproveitar conexões com domínios repetidos.
+    """
     semaphore = asyncio.Semaphore(concurrency)
 
     async with httpx.AsyncClient(
         headers={'User-Agent': 'Mozilla/5.0 (compatible; LinkValidator/1.0)'},
         follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=concurrency * 2,
+            max_keepalive_connections=concurrency,
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
     ) as client:
-        tasks = []
+        # Valida cada URL uma única vez e replica o resultado nos links iguais
+        links_by_url: dict[str, list[dict]] = {}
         for link in links:
-            task = validate_url(client, link['url'], semaphore)
-            tasks.append(task)
+            links_by_url.setdefault(link['url'], []).append(link)
+        urls = list(links_by_url)
+
+        tasks = [
+            validate_url(client, idx, url, semaphore)
+            for idx, url in enumerate(urls)
+        ]
 
-        results = []
         with tqdm(total=len(tasks), desc="Validando URLs") as pbar:
             for coro in asyncio.as_completed(tasks):
-                result = await coro
-                results.append(result)
+                idx, validation = await coro
+                for link in links_by_url[urls[idx]]:
+                    link.update(validation)
                 pbar.update(1)
 
-        # Mapeia resultados de volta (ordem pode ter mudado)
-        # Refaz com gather para manter ordem
-        results = await asyncio.gather(*[
-            validate_url(client, link['url'], semaphore)
-            for link in links
-        ])
-
-        for link, validation in zip(links, results):
-            link.update(validation)
-
     return links
 
 
 def extract_links(input_path: Path, limit: int | None = None) -> list[dict]:
     """Extrai e processa todos os links do arquivo."""
-    text = input_path.read_text(encoding='utf-8')
-
     seen_urls: dict[str, dict] = {}
+    seen_originals: set[str] = set()
+
+    with input_path.open(encoding='utf-8') as f:
+        for item in parse_whatsapp_export(f):
+            url_original = item['url_original']
+
+            # Links recompartilhados: nem precisa limpar de novo
+            if url_original in seen_originals:
+                continue
+            seen_originals.add(url_original)
+
+            url_clean = clean_url(url_original)
+
+            # Ignora se já vimos essa URL limpa
+            if url_clean in seen_urls:
+                continue
+
+            domain = extract_domain(url_clean)
+            title = generate_title(url_clean, domain)
+
+            seen_urls[url_clean] = {
+                'url': url_clean,
+                'url_original': url_original if url_original != url_clean else None,
+                'domain': domain,
+                'title': title,
+                'shared_by': item['shared_by'],
+                'date': item['date'],
+                'status': 'pending',
+            }
 
-    for item in parse_whatsapp_export(text):
-        url_original = item['url_original']
-        url_clean = clean_url(url_original)
-
-        # Ignora se já vimos essa URL limpa
-        if url_clean in seen_urls:
-            continue
-
-        domain = extract_domain(url_clean)
-        title = generate_title(url_clean, domain)
-
-        seen_urls[url_clean] = {
-            'url': url_clean,
-            'url_original': url_original if url_original != url_clean else None,
-            'domain': domain,
-            'title': title,
-            'shared_by': item['shared_by'],
-            'date': item['date'],
-            'status': 'pending',
-        }
-
-        if limit and len(seen_urls) >= limit:
-            break
+            if limit and len(seen_urls) >= limit:
+                break
 
     return list(seen_urls.values())
 
@@ -378,18 +469,16 @@ def main() -> int:
 
     # Saída
     if args.format == 'jsonl':
-        output_text = '\n'.join(
-            json.dumps(link, ensure_ascii=False) for link in links
-        )
+        output = b'\n'.join(dumps_json(link) for link in links)
     else:
-        output_text = json.dumps(links, ensure_ascii=False, indent=2)
+        output = dumps_json(links, indent=True)
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(output_text, encoding='utf-8')
+        args.output.write_bytes(output)
         print(f"Salvo em {args.output}", file=sys.stderr)
     else:
-        print(output_text)
+        sys.stdout.buffer.write(output + b'\n')
 
     return 0
 
@@ -18,17 +18,72 @@ Filosofia UNIX:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import re
-from pathlib import Path
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+# Módulos usados só no modo diretório (json, mmap, subprocess, threads) e
+# pathlib são importados sob demanda: o caminho stdin, comum em pipelines
+# e laços de shell, não paga por eles na inicialização.
+if TYPE_CHECKING:
+    from pathlib import Path
 
+
+# Quantificadores possessivos (Python 3.11+) no prefixo: espaços e
+# parênteses opcionais nunca precisam ser devolvidos para o casamento dar
+# certo, então candidatos "+55" inválidos (listas de contatos, números
+# quebrados) falham sem retrocesso. Só o bloco do meio ({4,5}) retrocede.
 BR_PHONE_PATTERN = re.compile(
-    r"(?P<prefix>\+55\s*\(?\s*\d{2}\s*\)?\s*)(?P<mid>\d{4,5})(?P<tail>-\d{4})"
+    r"(\+55\s*+\(?+\s*+\d{2}\s*+\)?+\s*+)\d{4,5}(-\d{4})"
+)
+
+# Mesmo padrão sobre bytes UTF-8, para processar arquivos sem decodificá-los.
+# Em `str`, \s também casa espaços Unicode (ex.: NBSP); em bytes eles viram
+# sequências UTF-8 e precisam ser listados explicitamente.
+_ESPACO_B = rb"(?:[\s\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+BR_PHONE_PATTERN_B = re.compile(
+    rb"(\+55" + _ESPACO_B + rb"*+\(?+" + _ESPACO_B + rb"*+\d{2}" + _ESPACO_B + rb"*+\)?+" + _ESPACO_B + rb"*+)"
+    rb"\d{4,5}(-\d{4})"
 )
 
+# Grupos posicionais: 1 = DDI+DDD (com espaços/parênteses), 2 = "-" e os
+# quatro dígitos finais; o bloco do meio não é capturado.
+# Template de substituição em `str`: aplicado pelo próprio `re`, sem
+# callback Python por ocorrência.
+_REPL = r"\1🫣\2"
+
+# Em bytes, "🫣" já vai codificado em UTF-8. Método já ligado ao padrão,
+# usado no laço quente do modo diretório.
+_EMOJI_B = "🫣".encode("utf-8")
+_FINDITER_B = BR_PHONE_PATTERN_B.finditer
+
+# Cache de arquivos já limpos, gravado em `--cache-dir` (fora do diretório
+# processado, que pode ser publicado): um arquivo por diretório raiz
+CACHE_DEFAULT_DIR = ".cache"
+
+# Arquivos por chamada ao grep (limita o tamanho da linha de comando)
+GREP_LOTE = 1000
+
+# Arquivos pequenos são concatenados em lotes de até LOTE_MAX_BYTES e
+# varridos numa única chamada ao regex. O separador não pode fazer parte de
+# um telefone, então nenhuma ocorrência atravessa dois arquivos.
+ARQUIVO_PEQUENO_BYTES = 64 * 1024
+LOTE_MAX_BYTES = 1024 * 1024
+_SEPARADOR = b"\x00"
 
-def ofuscar_telefones_br(texto: str) -> str:
+# Textos curtos (ex.: mensagem a mensagem, quando importado) se repetem
+# muito; acima deste tamanho não vale guardar o texto no cache
+CACHE_MAX_CHARS = 4096
+
+
+@lru_cache(maxsize=1024)
+def _ofuscar_cached(texto: str) -> str:
+    return BR_PHONE_PATTERN.sub(_REPL, texto)
+
+
+def ofuscar_telefones_br(texto: str, _sub=BR_PHONE_PATTERN.sub) -> str:
     """Ofusca telefones brasileiros no formato `+55 DD XXXXX-XXXX`.
 
     Mantém o DDI (+55), DDD (2 dígitos) e os últimos 4 dígitos,
@@ -45,10 +100,75 @@ def ofuscar_telefones_br(texto: str) -> str:
         Conteúdo com telefones ofuscados.
     """
 
-    def _sub(m: re.Match) -> str:
-        return f"{m.group('prefix')}🫣{m.group('tail')}"
+    # Todo telefone começa com o literal "+55": busca de substring é bem
+    # mais barata que o regex e descarta a maioria dos textos
+    if "+55" not in texto:
+        return texto
+
+    if len(texto) < CACHE_MAX_CHARS:
+        return _ofuscar_cached(texto)
+    return _sub(_REPL, texto)
+
+
+def ofuscar_telefones_bytes(dados: bytes) -> tuple[bytes | bytearray, int]:
+    """Versão de `ofuscar_telefones_br` para conteúdo UTF-8 em bytes.
+
+    Evita decodificar/recodificar o arquivo inteiro: o padrão é ASCII e o
+    substituto é inserido já em UTF-8.
+
+    Retorna:
+        Tupla (conteúdo ofuscado, número de telefones substituídos).
+    """
+    if b"+55" not in dados:
+        return dados, 0
+    return _substituir_bytes(dados)
+
+
+def _substituir_bytes(dados) -> tuple[bytes | bytearray, int]:
+    """Aplica a substituição montando a saída num único `bytearray`.
 
-    return BR_PHONE_PATTERN.sub(_sub, texto)
+    Só o bloco do meio muda: os trechos entre ocorrências são copiados direto
+    para o buffer de saída, sem a lista de pedaços que o `sub` monta e junta.
+    Quando todos os blocos do meio têm 4 dígitos, o emoji (4 bytes em UTF-8)
+    ocupa exatamente o mesmo espaço e a cópia do conteúdo é sobrescrita no
+    lugar. Aceita qualquer objeto de buffer (bytes, mmap).
+    """
+    # O bloco do meio fica entre o fim do prefixo e o início do sufixo
+    meios = [(m.end(1), m.start(2)) for m in _FINDITER_B(dados)]
+    if not meios:
+        return bytes(dados), 0
+
+    if all(fim - inicio == 4 for inicio, fim in meios):
+        saida = bytearray(dados)
+        for inicio, fim in meios:
+            saida[inicio:fim] = _EMOJI_B
+        return saida, len(meios)
+
+    saida = bytearray()
+    ultimo = 0
+    for inicio, fim in meios:
+        saida += dados[ultimo:inicio]
+        saida += _EMOJI_B
+        ultimo = fim
+    saida += dados[ultimo:]
+    return saida, len(meios)
+
+
+def gravar_atomico(caminho: str | Path, dados: bytes | bytearray) -> None:
+    """Grava `dados` em `caminho` de forma atômica.
+
+    Escreve num arquivo `.tmp` ao lado e troca com `os.replace`: uma queda
+    no meio da escrita nunca deixa o arquivo original truncado. As
+    permissões do original são preservadas.
+    """
+    tmp = f"{caminho}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(dados)
+    try:
+        os.chmod(tmp, os.stat(caminho).st_mode & 0o7777)
+    except FileNotFoundError:
+        pass
+    os.replace(tmp, caminho)
 
 
 def processar_arquivo(caminho: Path, in_place: bool) -> int:
@@ -64,20 +184,201 @@ def processar_arquivo(caminho: Path, in_place: bool) -> int:
         print(f"Erro: arquivo não encontrado: {caminho}", file=sys.stderr)
         return 2
 
-    texto = caminho.read_text(encoding="utf-8")
-    novo = ofuscar_telefones_br(texto)
+    dados = caminho.read_bytes()
+    novo, n = ofuscar_telefones_bytes(dados)
 
     if in_place:
-        if novo != texto:
-            caminho.write_text(novo, encoding="utf-8")
+        if n:
+            gravar_atomico(caminho, novo)
         return 0
 
-    # Saída para stdout quando não é in-place
-    sys.stdout.write(novo)
+    # Saída para stdout quando não é in-place (bytes já estão em UTF-8)
+    sys.stdout.buffer.write(novo)
     return 0
 
 
-def processar_diretorio(raiz: Path, in_place: bool) -> int:
+def _assinatura(st: os.stat_result) -> list[int]:
+    """Identifica uma versão do arquivo sem lê-lo: [mtime_ns, tamanho]."""
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _processar_um(caminho: str) -> tuple[list[int] | None, str | None]:
+    """Ofusca um arquivo in-place.
+
+    Retorna:
+        Tupla (assinatura do arquivo já limpo, mensagem de erro). A
+        assinatura é None quando houve erro.
+    """
+    import mmap
+
+    try:
+        with open(caminho, "rb") as f:
+            st = os.fstat(f.fileno())
+            # mmap de arquivo vazio levanta ValueError
+            if st.st_size == 0:
+                return _assinatura(st), None
+            # Visão zero-cópia: o regex em bytes lê direto das páginas do
+            # arquivo, e arquivos sem "+55" nem chegam a ser copiados
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"+55") == -1:
+                    return _assinatura(st), None
+                novo, n = _substituir_bytes(mm)
+        if n:
+            gravar_atomico(caminho, novo)
+            st = os.stat(caminho)
+        return _assinatura(st), None
+    except Exception as exc:  # noqa: BLE001
+        return None, f"Erro ao processar {caminho}: {exc}"
+
+
+def _processar_lote(caminhos: list[str]) -> list[tuple[list[int] | None, str | None]]:
+    """Ofusca vários arquivos pequenos in-place com uma única varredura.
+
+    Junta o conteúdo com `_SEPARADOR`, aplica o regex uma vez e separa o
+    resultado de volta; só reescreve os arquivos cujo trecho mudou. Se algum
+    arquivo contiver o separador ou não puder ser lido, processa um a um.
+
+    Retorna:
+        Uma tupla (assinatura, erro) por arquivo, como `_processar_um`.
+    """
+    if len(caminhos) == 1:
+        return [_processar_um(caminhos[0])]
+
+    conteudos = []
+    assinaturas = []
+    try:
+        for caminho in caminhos:
+            with open(caminho, "rb") as f:
+                assinaturas.append(_assinatura(os.fstat(f.fileno())))
+                conteudos.append(f.read())
+    except OSError:
+        return [_processar_um(caminho) for caminho in caminhos]
+    if any(_SEPARADOR in dados for dados in conteudos):
+        return [_processar_um(caminho) for caminho in caminhos]
+
+    novo, n = _substituir_bytes(_SEPARADOR.join(conteudos))
+    if not n:
+        return [(assinatura, None) for assinatura in assinaturas]
+
+    resultados = []
+    for caminho, antigo, parte, assinatura in zip(
+        caminhos, conteudos, bytes(novo).split(_SEPARADOR), assinaturas
+    ):
+        try:
+            if parte != antigo:
+                gravar_atomico(caminho, parte)
+                assinatura = _assinatura(os.stat(caminho))
+            resultados.append((assinatura, None))
+        except Exception as exc:  # noqa: BLE001
+            resultados.append((None, f"Erro ao processar {caminho}: {exc}"))
+    return resultados
+
+
+def _agrupar_em_lotes(
+    caminhos: list[str], assinaturas: dict[str, list[int] | None]
+) -> list[list[str]]:
+    """Agrupa arquivos pequenos em lotes; arquivos grandes ficam sozinhos."""
+    lotes: list[list[str]] = []
+    lote: list[str] = []
+    tamanho_lote = 0
+    for caminho in caminhos:
+        assinatura = assinaturas.get(caminho)
+        tamanho = assinatura[1] if assinatura is not None else None
+        if tamanho is None or tamanho > ARQUIVO_PEQUENO_BYTES:
+            lotes.append([caminho])
+            continue
+        if lote and tamanho_lote + tamanho > LOTE_MAX_BYTES:
+            lotes.append(lote)
+            lote, tamanho_lote = [], 0
+        lote.append(caminho)
+        tamanho_lote += tamanho
+    if lote:
+        lotes.append(lote)
+    return lotes
+
+
+def caminho_rel(caminho: str, raiz: Path) -> str:
+    """Chave do cache: caminho relativo à raiz, independente do cwd."""
+    return os.path.relpath(caminho, raiz)
+
+
+def caminho_cache(cache_dir: Path, raiz: Path) -> Path:
+    """Arquivo de cache de um diretório raiz, identificado pelo caminho absoluto."""
+    import hashlib
+
+    chave = hashlib.sha1(os.path.abspath(raiz).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / "obfuscate" / f"{chave}.json"
+
+
+def versao_cache() -> str:
+    """Versão do cache: hash do padrão de telefone.
+
+    Se o padrão mudar (ex.: passar a aceitar outro formato), arquivos
+    marcados como limpos pelo padrão antigo voltam a ser varridos.
+    """
+    import hashlib
+
+    return hashlib.sha1(BR_PHONE_PATTERN_B.pattern).hexdigest()[:16]
+
+
+def carregar_cache(caminho: Path) -> dict[str, list[int]]:
+    """Lê o cache de arquivos já limpos.
+
+    Cache ausente, inválido ou gravado com outra versão (ver `versao_cache`)
+    vira vazio.
+    """
+    import json
+
+    try:
+        dados = json.loads(caminho.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(dados, dict) or dados.get("versao") != versao_cache():
+        return {}
+    arquivos = dados.get("arquivos")
+    return arquivos if isinstance(arquivos, dict) else {}
+
+
+def salvar_cache(caminho: Path, cache: dict[str, list[int]]) -> None:
+    """Grava o cache de arquivos já limpos, criando o diretório se preciso."""
+    import json
+
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    dados = {"versao": versao_cache(), "arquivos": cache}
+    gravar_atomico(caminho, json.dumps(dados, ensure_ascii=False).encode("utf-8"))
+
+
+def filtrar_com_grep(caminhos: list[str]) -> list[str] | None:
+    """Filtra, com o `grep` do sistema, os arquivos que contêm "+55".
+
+    Uma única busca nativa por lote substitui a abertura e varredura de cada
+    arquivo pelo Python.
+
+    Retorna:
+        Lista de arquivos com candidatos, ou None se o grep não estiver
+        disponível ou falhar (o chamador processa todos os arquivos).
+    """
+    import subprocess
+
+    com_candidato = []
+    for i in range(0, len(caminhos), GREP_LOTE):
+        lote = caminhos[i:i + GREP_LOTE]
+        try:
+            # --null separa os nomes com \0 (aceito por GNU e BSD grep)
+            proc = subprocess.run(
+                ["grep", "-lF", "--null", "-e", "+55", "--", *lote],
+                capture_output=True,
+            )
+        except OSError:
+            return None
+        # 0 = achou, 1 = nenhum arquivo casou, >1 = erro
+        if proc.returncode > 1:
+            return None
+        com_candidato.extend(os.fsdecode(nome) for nome in proc.stdout.split(b"\0") if nome)
+    return com_candidato
+
+
+def processar_diretorio(raiz: Path, in_place: bool, cache_dir: Path) -> int:
     """Processa todos os arquivos `.md` de um diretório (recursivo).
 
     Por segurança/clareza, diretórios exigem `--in_place`.
@@ -96,17 +397,67 @@ def processar_diretorio(raiz: Path, in_place: bool) -> int:
         print("Erro: para diretórios, use --in_place para editar arquivos no local.", file=sys.stderr)
         return 1
 
-    for caminho in raiz.rglob("*.md"):
+    # Arquivos já limpos e inalterados (mesmo mtime e tamanho) desde a última
+    # execução são pulados sem sequer abri-los
+    cache_path = caminho_cache(cache_dir, raiz)
+    cache = carregar_cache(cache_path)
+
+    # os.walk trabalha com `str` e evita os objetos Path do rglob; um stat
+    # por arquivo é bem mais barato que abrir e varrer o conteúdo.
+    # O cache novo só guarda arquivos que ainda existem.
+    novo_cache: dict[str, list[int]] = {}
+    caminhos = []
+    assinaturas: dict[str, list[int] | None] = {}
+    for dirpath, _, arquivos in os.walk(raiz):
+        for nome in arquivos:
+            if not nome.endswith(".md"):
+                continue
+            caminho = os.path.join(dirpath, nome)
+            chave = caminho_rel(caminho, raiz)
+            try:
+                assinatura = _assinatura(os.stat(caminho))
+            except OSError:
+                assinatura = None
+            if assinatura is not None and cache.get(chave) == assinatura:
+                novo_cache[chave] = assinatura
+            else:
+                caminhos.append(caminho)
+                assinaturas[caminho] = assinatura
+
+    # Só arquivos com o literal "+55" precisam passar pelo regex; os demais
+    # já entram no cache como limpos
+    if caminhos:
+        com_candidato = filtrar_com_grep(caminhos)
+        if com_candidato is not None:
+            candidatos = set(com_candidato)
+            for caminho in caminhos:
+                if caminho not in candidatos and assinaturas[caminho] is not None:
+                    novo_cache[caminho_rel(caminho, raiz)] = assinaturas[caminho]
+            caminhos = com_candidato
+
+    # Leitura e escrita dominam o custo: threads sobrepõem a latência de I/O
+    from concurrent.futures import ThreadPoolExecutor
+
+    lotes = _agrupar_em_lotes(caminhos, assinaturas)
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    erros = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for lote, resultados in zip(lotes, executor.map(_processar_lote, lotes)):
+            for caminho, (assinatura, erro) in zip(lote, resultados):
+                if erro:
+                    erros.append(erro)
+                else:
+                    novo_cache[caminho_rel(caminho, raiz)] = assinatura
+
+    if novo_cache != cache:
         try:
-            texto = caminho.read_text(encoding="utf-8")
-            novo = ofuscar_telefones_br(texto)
-            if novo != texto:
-                caminho.write_text(novo, encoding="utf-8")
-        except Exception as exc:  # noqa: BLE001
-            print(f"Erro ao processar {caminho}: {exc}", file=sys.stderr)
-            return 1
+            salvar_cache(cache_path, novo_cache)
+        except OSError as exc:
+            print(f"Aviso: não foi possível gravar o cache {cache_path}: {exc}", file=sys.stderr)
 
-    return 0
+    for erro in erros:
+        print(erro, file=sys.stderr)
+    return 1 if erros else 0
 
 
 def main() -> int:
@@ -125,6 +476,11 @@ def main() -> int:
         action="store_true",
         help="Edita arquivos no local (obrigatório para diretórios)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=CACHE_DEFAULT_DIR,
+        help=f"Diretório do cache de arquivos já limpos, no modo diretório (default: {CACHE_DEFAULT_DIR})",
+    )
     args = parser.parse_args()
 
     # Modo stdin
@@ -132,14 +488,17 @@ def main() -> int:
         if sys.stdin.isatty():
             print("Erro: nenhuma entrada via stdin", file=sys.stderr)
             return 1
-        conteudo = sys.stdin.read()
-        sys.stdout.write(ofuscar_telefones_br(conteudo))
+        # Bytes direto do pipe: sem decodificar/recodificar pelo TextIOWrapper
+        novo, _ = ofuscar_telefones_bytes(sys.stdin.buffer.read())
+        sys.stdout.buffer.write(novo)
         return 0
 
+    from pathlib import Path
+
     caminho = Path(args.path)
 
     if caminho.is_dir():
-        return processar_diretorio(caminho, args.in_place)
+        return processar_diretorio(caminho, args.in_place, Path(args.cache_dir))
     elif caminho.is_file():
         return processar_arquivo(caminho, args.in_place)
     else:
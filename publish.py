@@ -3,37 +3,65 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "markdown",
+#     "orjson",
+#     "rcssmin",
+#     "rjsmin",
 # ]
 # ///
 """Gera site HTML estático a partir dos resumos markdown."""
 
 import argparse
+import gzip
+import hashlib
 import html
+import io
 import json
+import os
 import re
 import shutil
+import string
 import sys
-from collections import defaultdict
-from datetime import datetime
+import unicodedata
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import markdown
+from markdown.extensions import Extension
+from markdown.inlinepatterns import LINK_RE, LinkInlineProcessor
+from markdown.treeprocessors import Treeprocessor
+from markdown.util import HTML_PLACEHOLDER_RE
+import rcssmin
+import rjsmin
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Template HTML base (estilo brutalist inspirado no core-mba.pro)
-BASE_TEMPLATE = """<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{title} | IA+Educação</title>
-  <meta name="description" content="{description}">
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&family=Space+Mono:wght@400;700&display=swap" rel="stylesheet">
-  <style>
-:root {{
+
+def dumps_json(obj) -> bytes:
+    """Serializa em JSON UTF-8 compacto, usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes | str):
+    """Desserializa JSON, usando orjson quando disponível."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Folha de estilo do site (estilo brutalist inspirado no core-mba.pro),
+# publicada como arquivo externo em assets/
+SITE_CSS = """:root {
   --bg-primary: #f3f4f6;
   --bg-secondary: #ffffff;
   --text-primary: #000000;
@@ -44,9 +72,9 @@ BASE_TEMPLATE = """<!DOCTYPE html>
   --border-light: #d1d5db;
   --font-main: 'Space Grotesk', -apple-system, sans-serif;
   --font-mono: 'Space Mono', monospace;
-}}
-*, *::before, *::after {{ box-sizing: border-box; margin: 0; padding: 0; }}
-body {{
+}
+*, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
+body {
   font-family: var(--font-main);
   color: var(--text-primary);
   line-height: 1.6;
@@ -56,59 +84,59 @@ body {{
   background-color: var(--bg-primary);
   background-image: radial-gradient(circle, #00000015 1px, transparent 1px);
   background-size: 20px 20px;
-}}
-.migration-banner {{
+}
+.migration-banner {
   background: #F9DC03;
   color: #000000;
   padding: 0.75rem 1.5rem;
   text-align: center;
   font-family: var(--font-mono);
   font-size: 0.875rem;
-}}
-.migration-banner a {{ color: #000000; font-weight: 700; text-decoration: underline; }}
-.header {{
+}
+.migration-banner a { color: #000000; font-weight: 700; text-decoration: underline; }
+.header {
   position: sticky;
   top: 0;
   background: var(--bg-secondary);
   border-bottom: 2px solid var(--border-color);
   z-index: 100;
   padding: 1rem 1.5rem;
-}}
-.header-content {{
+}
+.header-content {
   max-width: 1200px;
   margin: 0 auto;
   display: flex;
   justify-content: space-between;
   align-items: center;
-}}
-.logo {{
+}
+.logo {
   text-decoration: none;
   font-family: var(--font-mono);
   font-size: 1.25rem;
   font-weight: 700;
   color: var(--text-primary);
-}}
-.logo-bracket {{ color: var(--accent-blue); }}
-.nav {{
+}
+.logo-bracket { color: var(--accent-blue); }
+.nav {
   display: flex;
   align-items: center;
   gap: 1.5rem;
   font-family: var(--font-mono);
   font-size: 0.875rem;
-}}
-.nav a {{ color: var(--text-secondary); text-decoration: none; transition: color 0.15s; }}
-.nav a:hover {{ color: var(--text-primary); }}
-.nav-separator {{ color: var(--border-light); }}
-.main {{
+}
+.nav a { color: var(--text-secondary); text-decoration: none; transition: color 0.15s; }
+.nav a:hover { color: var(--text-primary); }
+.nav-separator { color: var(--border-light); }
+.main {
   flex: 1;
   max-width: 1200px;
   margin: 0 auto;
   padding: 3rem 1.5rem;
   width: 100%;
-}}
+}
 /* Search */
-.search-container {{ margin-bottom: 2rem; }}
-.search-input {{
+.search-container { margin-bottom: 2rem; }
+.search-input {
   width: 100%;
   padding: 1rem;
   font-family: var(--font-mono);
@@ -116,21 +144,21 @@ body {{
   border: 2px solid var(--border-color);
   background: var(--bg-secondary);
   outline: none;
-}}
-.search-input:focus {{ box-shadow: 4px 4px 0 var(--border-color); }}
-.search-input::placeholder {{ color: var(--text-secondary); }}
-.search-stats {{
+}
+.search-input:focus { box-shadow: 4px 4px 0 var(--border-color); }
+.search-input::placeholder { color: var(--text-secondary); }
+.search-stats {
   margin-top: 0.5rem;
   font-family: var(--font-mono);
   font-size: 0.75rem;
   color: var(--text-secondary);
-}}
-.search-results {{
+}
+.search-results {
   margin-top: 1.5rem;
   display: none;
-}}
-.search-results.active {{ display: block; }}
-.search-result-item {{
+}
+.search-results.active { display: block; }
+.search-result-item {
   background: var(--bg-secondary);
   border: 2px solid var(--border-color);
   padding: 1.25rem;
@@ -139,59 +167,59 @@ body {{
   color: var(--text-primary);
   display: block;
   transition: all 0.15s;
-}}
-.search-result-item:hover {{
+}
+.search-result-item:hover {
   transform: translateY(-2px);
   box-shadow: 4px 4px 0 var(--border-color);
-}}
-.search-result-title {{
+}
+.search-result-title {
   font-weight: 700;
   font-size: 1.125rem;
   margin-bottom: 0.5rem;
   color: var(--accent-blue);
-}}
-.search-result-meta {{
+}
+.search-result-meta {
   font-family: var(--font-mono);
   font-size: 0.75rem;
   color: var(--text-secondary);
   margin-bottom: 0.75rem;
-}}
-.search-result-snippet {{
+}
+.search-result-snippet {
   font-size: 0.875rem;
   color: var(--text-secondary);
   line-height: 1.6;
-}}
-.search-result-snippet mark {{
+}
+.search-result-snippet mark {
   background: var(--accent-yellow);
   color: var(--text-primary);
   padding: 0.1em 0.2em;
-}}
-.no-results {{
+}
+.no-results {
   text-align: center;
   padding: 3rem;
   color: var(--text-secondary);
   display: none;
-}}
-.no-results.active {{ display: block; }}
-.page-header {{
+}
+.no-results.active { display: block; }
+.page-header {
   margin-bottom: 2rem;
   padding-bottom: 1.5rem;
   border-bottom: 2px solid var(--border-color);
-}}
-.page-title {{
+}
+.page-title {
   font-family: var(--font-mono);
   font-size: 2rem;
   font-weight: 700;
   margin-bottom: 0.5rem;
-}}
-.page-subtitle {{ font-size: 1rem; color: var(--text-secondary); }}
-.posts-grid {{
+}
+.page-subtitle { font-size: 1rem; color: var(--text-secondary); }
+.posts-grid {
   display: grid;
   grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
   gap: 1.5rem;
-}}
-.posts-grid.hidden {{ display: none; }}
-.post-card {{
+}
+.posts-grid.hidden { display: none; }
+.post-card {
   background: var(--bg-secondary);
   border: 2px solid var(--border-color);
   padding: 1.5rem;
@@ -201,12 +229,12 @@ body {{
   display: flex;
   flex-direction: column;
   position: relative;
-}}
-.post-card:hover {{
+}
+.post-card:hover {
   transform: translateY(-2px);
   box-shadow: 4px 4px 0 var(--border-color);
-}}
-.badge-new {{
+}
+.badge-new {
   position: absolute;
   top: -8px;
   right: -8px;
@@ -219,14 +247,14 @@ body {{
   font-family: var(--font-mono);
   text-transform: uppercase;
   box-shadow: 2px 2px 0 rgba(0,0,0,0.2);
-}}
-.post-card-header {{
+}
+.post-card-header {
   display: flex;
   justify-content: space-between;
   align-items: center;
   margin-bottom: 1rem;
-}}
-.post-card-action {{
+}
+.post-card-action {
   font-family: var(--font-mono);
   font-size: 0.625rem;
   padding: 0.25rem 0.5rem;
@@ -235,12 +263,12 @@ body {{
   color: var(--text-secondary);
   text-decoration: none;
   transition: all 0.15s;
-}}
-.post-card-action:hover {{
+}
+.post-card-action:hover {
   border-color: #25D366;
   color: #25D366;
-}}
-.post-card-image {{
+}
+.post-card-image {
   width: 100%;
   height: 120px;
   background: var(--bg-primary);
@@ -252,8 +280,8 @@ body {{
   font-family: var(--font-mono);
   font-size: 0.625rem;
   color: var(--text-secondary);
-}}
-.post-card-category {{
+}
+.post-card-category {
   font-family: var(--font-mono);
   font-size: 0.625rem;
   font-weight: 700;
@@ -262,161 +290,161 @@ body {{
   color: var(--accent-blue);
   background: rgba(37, 99, 235, 0.1);
   padding: 0.25rem 0.5rem;
-}}
-.post-card-date {{
+}
+.post-card-date {
   font-family: var(--font-mono);
   font-size: 0.75rem;
   color: var(--text-secondary);
-}}
-.post-card-title {{
+}
+.post-card-title {
   font-size: 1.125rem;
   font-weight: 700;
   margin-bottom: 0.5rem;
   line-height: 1.3;
-}}
-.post-card-excerpt {{
+}
+.post-card-excerpt {
   font-size: 0.875rem;
   color: var(--text-secondary);
   line-height: 1.5;
   flex: 1;
-}}
-.post-card-footer {{
+}
+.post-card-footer {
   margin-top: 0;
   padding-top: 0;
   font-family: var(--font-mono);
   font-size: 0.75rem;
   color: var(--accent-blue);
-}}
-.post-card-stats {{
+}
+.post-card-stats {
   display: flex;
   gap: 1rem;
   font-family: var(--font-mono);
   font-size: 0.75rem;
   color: var(--text-secondary);
   margin-top: 0.75rem;
-}}
-.post-card-divider {{
+}
+.post-card-divider {
   border: none;
   border-top: 1px solid var(--border-light);
   margin: 0.75rem 0;
-}}
-.back-link {{
+}
+.back-link {
   display: inline-block;
   margin-bottom: 1.5rem;
   font-family: var(--font-mono);
   font-size: 0.875rem;
   color: var(--text-secondary);
   text-decoration: none;
-}}
-.back-link:hover {{ color: var(--text-primary); }}
-.back-link::before {{ content: "< "; }}
-.post-header {{
+}
+.back-link:hover { color: var(--text-primary); }
+.back-link::before { content: "< "; }
+.post-header {
   margin-bottom: 2rem;
   padding-bottom: 1.5rem;
   border-bottom: 2px solid var(--border-color);
-}}
-.post-meta {{
+}
+.post-meta {
   display: flex;
   gap: 1rem;
   margin-bottom: 1rem;
   font-family: var(--font-mono);
   font-size: 0.75rem;
-}}
-.post-category {{
+}
+.post-category {
   color: var(--accent-blue);
   text-transform: uppercase;
   letter-spacing: 0.1em;
   font-weight: 700;
-}}
-.post-date {{ color: var(--text-secondary); }}
-.post-title {{ font-size: 2rem; font-weight: 700; line-height: 1.2; }}
-.post-week {{
+}
+.post-date { color: var(--text-secondary); }
+.post-title { font-size: 2rem; font-weight: 700; line-height: 1.2; }
+.post-week {
   font-family: var(--font-mono);
   font-size: 0.875rem;
   color: var(--text-secondary);
   margin-top: 0.5rem;
-}}
-.content {{
+}
+.content {
   background: var(--bg-secondary);
   border: 2px solid var(--border-color);
   padding: 2rem;
-}}
-.content h2 {{
+}
+.content h2 {
   font-size: 1.5rem;
   font-weight: 700;
   margin-top: 3rem;
   margin-bottom: 1rem;
   padding-bottom: 0.5rem;
   border-bottom: 1px solid var(--border-light);
-}}
-.content h2:first-child {{ margin-top: 0; }}
-.content h3 {{ font-size: 1.125rem; font-weight: 700; margin-top: 2rem; margin-bottom: 0.5rem; }}
-.content p {{ margin-bottom: 1rem; }}
-.content ul, .content ol {{ margin-bottom: 1rem; padding-left: 1.5rem; }}
-.content li {{ margin-bottom: 0.5rem; }}
-.content li ul {{ margin-top: 0.5rem; margin-bottom: 0.5rem; }}
-.content a {{ color: var(--accent-blue); text-decoration: none; border-bottom: 1px solid transparent; }}
-.content a:hover {{ border-bottom-color: var(--accent-blue); }}
-.content strong {{ font-weight: 700; }}
+}
+.content h2:first-child { margin-top: 0; }
+.content h3 { font-size: 1.125rem; font-weight: 700; margin-top: 2rem; margin-bottom: 0.5rem; }
+.content p { margin-bottom: 1rem; }
+.content ul, .content ol { margin-bottom: 1rem; padding-left: 1.5rem; }
+.content li { margin-bottom: 0.5rem; }
+.content li ul { margin-top: 0.5rem; margin-bottom: 0.5rem; }
+.content a { color: var(--accent-blue); text-decoration: none; border-bottom: 1px solid transparent; }
+.content a:hover { border-bottom-color: var(--accent-blue); }
+.content strong { font-weight: 700; }
 /* Links page - Hacker News style */
-.links-list {{
+.links-list {
   background: var(--bg-secondary);
   border: 2px solid var(--border-color);
   padding: 0;
-}}
-.link-item {{
+}
+.link-item {
   display: flex;
   align-items: baseline;
   padding: 0.5rem 1rem;
   border-bottom: 1px solid var(--border-light);
   gap: 0.5rem;
-}}
-.link-item:last-child {{ border-bottom: none; }}
-.link-item.hidden {{ display: none; }}
-.link-item:hover {{ background: rgba(0,0,0,0.02); }}
-.link-rank {{
+}
+.link-item:last-child { border-bottom: none; }
+.link-item.hidden { display: none; }
+.link-item:hover { background: rgba(0,0,0,0.02); }
+.link-rank {
   font-family: var(--font-mono);
   font-size: 0.875rem;
   color: var(--text-secondary);
   min-width: 2.5rem;
   text-align: right;
-}}
-.link-content {{ flex: 1; min-width: 0; }}
-.link-title {{
+}
+.link-content { flex: 1; min-width: 0; }
+.link-title {
   font-size: 0.95rem;
   color: var(--text-primary);
   text-decoration: none;
   word-break: break-word;
-}}
-.link-title:hover {{ text-decoration: underline; }}
-.link-title:visited {{ color: #828282; }}
-.link-meta {{
+}
+.link-title:hover { text-decoration: underline; }
+.link-title:visited { color: #828282; }
+.link-meta {
   font-family: var(--font-mono);
   font-size: 0.75rem;
   color: var(--text-secondary);
   margin-top: 0.125rem;
-}}
-.link-meta a {{
+}
+.link-meta a {
   color: var(--text-secondary);
   text-decoration: none;
-}}
-.link-meta a:hover {{ text-decoration: underline; }}
-.link-domain {{
+}
+.link-meta a:hover { text-decoration: underline; }
+.link-domain {
   color: var(--text-secondary);
-}}
-.link-share {{
+}
+.link-share {
   color: var(--text-secondary);
   cursor: pointer;
   margin-left: 0.5rem;
-}}
-.link-share:hover {{ color: #25D366; }}
-.links-count {{
+}
+.link-share:hover { color: #25D366; }
+.links-count {
   font-family: var(--font-mono);
   font-size: 0.875rem;
   color: var(--text-secondary);
   margin-bottom: 1.5rem;
-}}
-.footer {{
+}
+.footer {
   background: var(--text-primary);
   color: var(--bg-secondary);
   padding: 1rem 1.5rem;
@@ -424,15 +452,40 @@ body {{
   text-align: center;
   font-family: var(--font-mono);
   font-size: 0.75rem;
-}}
-@media (max-width: 768px) {{
-  .header-content {{ flex-direction: column; gap: 1rem; }}
-  .page-title, .post-title {{ font-size: 1.5rem; }}
-  .posts-grid {{ grid-template-columns: 1fr; }}
-  .content {{ padding: 1rem; }}
-  .nav {{ flex-wrap: wrap; justify-content: center; }}
-}}
-  </style>
+}
+@media (max-width: 768px) {
+  .header-content { flex-direction: column; gap: 1rem; }
+  .page-title, .post-title { font-size: 1.5rem; }
+  .posts-grid { grid-template-columns: 1fr; }
+  .content { padding: 1rem; }
+  .nav { flex-wrap: wrap; justify-content: center; }
+}
+"""
+
+
+def hashed_asset(stem: str, ext: str, content: str) -> tuple[str, str]:
+    """Devolve (nome do arquivo com hash do conteúdo, conteúdo) de um asset.
+
+    O hash no nome permite cache HTTP longo: qualquer mudança gera outro arquivo.
+    """
+    digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:8]
+    return f"{stem}.{digest}.{ext}", content
+
+
+SITE_CSS_ASSET = hashed_asset("site", "css", rcssmin.cssmin(SITE_CSS))
+
+# Template HTML base
+BASE_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>{title} | IA+Educação</title>
+  <meta name="description" content="{description}">
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&family=Space+Mono:wght@400;700&display=swap" rel="stylesheet">
+  <link rel="stylesheet" href="{base_url}assets/{site_css}">
   <script defer data-domain="maluta.github.io" src="https://plausible.io/js/plausible.js"></script>
 </head>
 <body>
@@ -464,25 +517,77 @@ body {{
 </html>
 """
 
-# JavaScript para busca com índice completo
-SEARCH_SCRIPT_INDEX = """
-<script>
-(function() {{
+SCRIPT_BLOCK_PATTERN = re.compile(r"(<script>)(.*?)(</script>)", re.DOTALL)
+
+
+def minify_inline(markup: str) -> str:
+    """Minifica o conteúdo dos blocos <script> inline de um trecho HTML."""
+    return SCRIPT_BLOCK_PATTERN.sub(
+        lambda m: m[1] + rjsmin.jsmin(m[2]) + m[3], markup
+    )
+
+
+# BASE_TEMPLATE pré-dividido em trechos literais (já com {{ }} desfeitos) e
+# nomes de campo: cada página é montada com um único join, sem reanalisar o
+# template a cada chamada de str.format. O nome do CSS é fixo no build e já
+# entra direto no trecho literal
+_BASE_LITERALS: list[str] = [""]
+_BASE_FIELDS: list[str] = []
+for _literal, _field, _spec, _conv in string.Formatter().parse(BASE_TEMPLATE):
+    # O parser também quebra o texto em cada {{ }}: trechos seguidos sem
+    # campo entre eles são reunidos num só
+    _BASE_LITERALS[-1] += _literal
+    if _field == "site_css":
+        _BASE_LITERALS[-1] += SITE_CSS_ASSET[0]
+    elif _field is not None:
+        _BASE_FIELDS.append(_field)
+        _BASE_LITERALS.append("")
+
+
+def render_base(**values) -> str:
+    """Preenche o BASE_TEMPLATE (equivalente a `BASE_TEMPLATE.format(**values)`)."""
+    parts = [_BASE_LITERALS[0]]
+    for field, literal in zip(_BASE_FIELDS, _BASE_LITERALS[1:]):
+        parts.append(str(values[field]))
+        parts.append(literal)
+    return "".join(parts)
+
+
+def write_base(out: io.StringIO, content: Iterable[str], **values) -> None:
+    """Como `render_base`, mas escreve em `out` e recebe o conteúdo em pedaços."""
+    out.write(_BASE_LITERALS[0])
+    for field, literal in zip(_BASE_FIELDS, _BASE_LITERALS[1:]):
+        if field == "content":
+            for chunk in content:
+                out.write(chunk)
+        else:
+            out.write(str(values[field]))
+        out.write(literal)
+
+
+# JavaScript para busca com índice completo (assets/search.<hash>.js)
+SEARCH_JS_INDEX = """(function() {
+  // Configuração vem dos atributos data-* da própria tag <script>
+  const config = document.currentScript.dataset;
+  const BASE_URL = config.baseUrl;
+  const INDEX_HASH = config.indexHash;
+
   // Calcula e exibe "X dias atrás" nos cards
-  document.querySelectorAll('.post-card-footer[data-end-date]').forEach(footer => {{
+  document.querySelectorAll('.post-card-footer[data-end-date]').forEach(footer => {
     const endDate = new Date(footer.dataset.endDate);
     const today = new Date();
     const diffTime = today - endDate;
     const diffDays = Math.floor(diffTime / (1000 * 60 * 60 * 24));
-    if (diffDays >= 0) {{
+    if (diffDays >= 0) {
       const span = document.createElement('span');
       span.style.color = '#9ca3af';
-      span.textContent = ` (~ ${{diffDays}} dias atrás)`;
+      span.textContent = ` (~ ${diffDays} dias atrás)`;
       footer.appendChild(span);
-    }}
-  }});
+    }
+  });
 
   let searchIndex = null;
+  let postings = null;
   const searchInput = document.getElementById('searchInput');
   const searchResults = document.getElementById('searchResults');
   const postsGrid = document.getElementById('postsGrid');
@@ -491,19 +596,113 @@ SEARCH_SCRIPT_INDEX = """
 
   if (!searchInput) return;
 
-  // Carrega o índice de busca
-  fetch('{base_url}search-index.json')
-    .then(r => r.json())
-    .then(data => {{
-      searchIndex = data;
-      searchStats.textContent = `${{data.length}} resumos disponíveis para busca`;
-    }})
-    .catch(err => console.error('Erro ao carregar índice:', err));
+  // Baixa a versão .gz e descomprime no navegador (DecompressionStream);
+  // sem suporte ou em caso de falha, usa o JSON sem compressão
+  function loadJSON(name) {
+    const plain = () => fetch(BASE_URL + name).then(r => r.json());
+    if (typeof DecompressionStream === 'undefined') return plain();
+    return fetch(BASE_URL + name + '.gz')
+      .then(r => {
+        if (!r.ok) throw new Error(`HTTP ${r.status}`);
+        return new Response(r.body.pipeThrough(new DecompressionStream('gzip'))).json();
+      })
+      .catch(plain);
+  }
+
+  // Índice guardado no localStorage sob o hash do build: visitas seguintes
+  // não baixam nada até o site ser regerado com outro conteúdo
+  const INDEX_KEY = 'idx-' + INDEX_HASH;
+
+  function readCachedIndex() {
+    try {
+      const cached = localStorage.getItem(INDEX_KEY);
+      return cached ? JSON.parse(cached) : null;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  function storeIndex(parts) {
+    try {
+      // Remove índices de builds anteriores para não acumular
+      for (let i = localStorage.length - 1; i >= 0; i--) {
+        const key = localStorage.key(i);
+        if (key && key.startsWith('idx-') && key !== INDEX_KEY) localStorage.removeItem(key);
+      }
+      localStorage.setItem(INDEX_KEY, JSON.stringify(parts));
+    } catch (e) {
+      // Sem localStorage ou sem espaço: segue sem cache
+    }
+  }
+
+  function loadIndex() {
+    const cached = readCachedIndex();
+    if (cached) return Promise.resolve(cached);
+    return Promise.all([
+      loadJSON('search-index.json'),
+      loadJSON('search-postings.json'),
+    ]).then(parts => {
+      storeIndex(parts);
+      return parts;
+    });
+  }
+
+  // Carrega os documentos e o índice invertido (token -> documentos) só na
+  // primeira interação com a busca: quem não busca não baixa o índice
+  let indexPromise = null;
+  function ensureIndex() {
+    return indexPromise ||= loadIndex()
+      .then(([data, inverted]) => {
+        // O índice vem em colunas (chaves em data.k, valores em data.r);
+        // remonta os objetos uma vez e calcula as minúsculas por documento,
+        // não a cada tecla
+        const keys = data.k;
+        searchIndex = data.r.map(row => {
+          const item = {};
+          keys.forEach((key, i) => { item[key] = row[i]; });
+          item.cl = item.c.toLowerCase();
+          item.tl = item.t.toLowerCase();
+          return item;
+        });
+        postings = inverted;
+      })
+      .catch(err => {
+        // Permite tentar de novo na próxima interação
+        indexPromise = null;
+        console.error('Erro ao carregar índice:', err);
+      });
+  }
+
+  // Mesma normalização do índice (fold_search_text): minúsculas, sem acentos
+  function fold(text) {
+    return text.toLowerCase().normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '');
+  }
+
+  // Documentos com algum token do vocabulário que contém `term` (em
+  // qualquer posição, como a busca por substring)
+  function matchTerm(term) {
+    const vocab = postings.v;
+    const docs = new Set();
+    for (let i = 0; i < vocab.length; i++) {
+      if (vocab[i].includes(term)) {
+        for (const docId of postings.p[i]) docs.add(docId);
+      }
+    }
+    return docs;
+  }
+
+  // Prepara o highlight uma vez por consulta (não por resultado)
+  function buildSnippetRe(query) {
+    return {
+      query,
+      lowerQuery: query.toLowerCase(),
+      regex: new RegExp(`(${query.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&')})`, 'gi'),
+    };
+  }
 
   // Função para criar snippet com highlight
-  function createSnippet(text, query, maxLen = 200) {{
-    const lowerText = text.toLowerCase();
-    const lowerQuery = query.toLowerCase();
+  function applySnippet(text, lowerText, ctx, maxLen = 200) {
+    const { query, lowerQuery, regex } = ctx;
     const idx = lowerText.indexOf(lowerQuery);
 
     if (idx === -1) return text.slice(0, maxLen) + '...';
@@ -514,105 +713,157 @@ SEARCH_SCRIPT_INDEX = """
     let snippet = (start > 0 ? '...' : '') + text.slice(start, end) + (end < text.length ? '...' : '');
 
     // Faz highlight (case-insensitive)
-    const regex = new RegExp(`(${{query.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&')}})`, 'gi');
     snippet = snippet.replace(regex, '<mark>$1</mark>');
 
     return snippet;
-  }}
+  }
+
+  const MAX_RESULTS = 20;
+
+  // `a` fica abaixo de `b` no ranking: score menor ou, empatado, vem depois
+  // no índice (mesma ordem de uma ordenação estável por score)
+  function worse(a, b) {
+    return a.score < b.score || (a.score === b.score && a.docId > b.docId);
+  }
+
+  // Mantém em `heap` (heap mínimo pela ordem de `worse`) os MAX_RESULTS
+  // melhores itens vistos até agora
+  function pushTop(heap, entry) {
+    let i;
+    if (heap.length < MAX_RESULTS) {
+      heap.push(entry);
+      i = heap.length - 1;
+      while (i > 0) {
+        const parent = (i - 1) >> 1;
+        if (!worse(heap[i], heap[parent])) break;
+        [heap[i], heap[parent]] = [heap[parent], heap[i]];
+        i = parent;
+      }
+      return;
+    }
+    if (!worse(heap[0], entry)) return;
+    heap[0] = entry;
+    i = 0;
+    while (true) {
+      const left = 2 * i + 1, right = left + 1;
+      let smallest = i;
+      if (left < heap.length && worse(heap[left], heap[smallest])) smallest = left;
+      if (right < heap.length && worse(heap[right], heap[smallest])) smallest = right;
+      if (smallest === i) break;
+      [heap[i], heap[smallest]] = [heap[smallest], heap[i]];
+      i = smallest;
+    }
+  }
 
   // Função de busca
-  function search(query) {{
-    if (!searchIndex || query.length < 2) {{
+  function search(query) {
+    if (!searchIndex || query.length < 2) {
       searchResults.classList.remove('active');
       searchResults.innerHTML = '';
       postsGrid.classList.remove('hidden');
       noResults.classList.remove('active');
-      searchStats.textContent = `${{searchIndex ? searchIndex.length : 0}} resumos disponíveis para busca`;
+      if (searchIndex) searchStats.textContent = `${searchIndex.length} resumos disponíveis para busca`;
       return;
-    }}
+    }
 
     const lowerQuery = query.toLowerCase();
+    // Só os MAX_RESULTS melhores são exibidos: heap mínimo em vez de ordenar
+    // todos os documentos encontrados
     const results = [];
+    let total = 0;
+
+    // O índice invertido só pré-filtra: um documento que contém a consulta
+    // tem, para cada palavra dela, um token do vocabulário que a contém.
+    // A busca continua sendo por substring no texto de cada candidato
+    let candidates = null;
+    for (const token of fold(query).match(/[\\p{L}\\p{N}_]+/gu) || []) {
+      const matches = matchTerm(token);
+      if (candidates === null) {
+        candidates = matches;
+        continue;
+      }
+      for (const docId of candidates) {
+        if (!matches.has(docId)) candidates.delete(docId);
+      }
+    }
 
-    searchIndex.forEach(item => {{
-      const contentLower = item.content.toLowerCase();
-      const titleLower = item.title.toLowerCase();
-
-      // Conta ocorrências para ranking
-      let score = 0;
-      if (titleLower.includes(lowerQuery)) score += 10;
-
-      let idx = 0;
-      while ((idx = contentLower.indexOf(lowerQuery, idx)) !== -1) {{
-        score += 1;
-        idx += lowerQuery.length;
-      }}
+    searchIndex.forEach((item, docId) => {
+      // Título com o termo vale mais no ranking
+      let score = item.tl.includes(lowerQuery) ? 10 : 0;
+
+      // Conta ocorrências no conteúdo (só nos candidatos)
+      if (candidates === null || candidates.has(docId)) {
+        let idx = 0;
+        while ((idx = item.cl.indexOf(lowerQuery, idx)) !== -1) {
+          score += 1;
+          idx += lowerQuery.length;
+        }
+      }
 
-      if (score > 0) {{
-        results.push({{ ...item, score }});
-      }}
-    }});
+      if (score > 0) {
+        total++;
+        pushTop(results, { ...item, score, docId });
+      }
+    });
 
-    // Ordena por relevância
-    results.sort((a, b) => b.score - a.score);
+    // Ordena por relevância (só os selecionados)
+    results.sort((a, b) => (worse(a, b) ? 1 : worse(b, a) ? -1 : 0));
 
-    if (results.length === 0) {{
+    if (total === 0) {
       searchResults.classList.remove('active');
       searchResults.innerHTML = '';
       postsGrid.classList.add('hidden');
       noResults.classList.add('active');
-      searchStats.textContent = `Nenhum resultado para "${{query}}"`;
+      searchStats.textContent = `Nenhum resultado para "${query}"`;
       return;
-    }}
+    }
 
     // Renderiza resultados
     postsGrid.classList.add('hidden');
     noResults.classList.remove('active');
-    searchStats.textContent = `${{results.length}} resultado(s) para "${{query}}"`;
-
-    let html = '';
-    results.slice(0, 20).forEach(item => {{
-      const snippet = createSnippet(item.content, query);
-      // Calcula delta de dias
-      const endParts = item.week.split(' → ')[1].split('/');
-      const endDate = new Date(`${{endParts[2]}}-${{endParts[1]}}-${{endParts[0]}}`);
-      const diffDays = Math.floor((new Date() - endDate) / (1000*60*60*24));
-      const delta = diffDays >= 0 ? ` <span style="color:#9ca3af">(~ ${{diffDays}} dias atrás)</span>` : '';
-      html += `
-        <a href="${{item.url}}" class="search-result-item">
-          <div class="search-result-title">${{item.title}}</div>
-          <div class="search-result-meta">Semana: ${{item.week}}${{delta}}</div>
-          <div class="search-result-snippet">${{snippet}}</div>
+    searchStats.textContent = `${total} resultado(s) para "${query}"`;
+
+    const snippetCtx = buildSnippetRe(query);
+    // Delta de dias: item.e já vem do build em dias desde 1970-01-01
+    const today = Math.floor(Date.now() / (1000*60*60*24));
+    const parts = results.map(item => {
+      const snippet = applySnippet(item.c, item.cl, snippetCtx);
+      const diffDays = today - item.e;
+      const delta = diffDays >= 0 ? ` <span style="color:#9ca3af">(~ ${diffDays} dias atrás)</span>` : '';
+      return `
+        <a href="${BASE_URL}${item.s}.html" class="search-result-item">
+          <div class="search-result-title">${item.t}</div>
+          <div class="search-result-meta">Semana: ${item.w}${delta}</div>
+          <div class="search-result-snippet">${snippet}</div>
         </a>
       `;
-    }});
+    });
 
-    searchResults.innerHTML = html;
+    searchResults.innerHTML = parts.join('');
     searchResults.classList.add('active');
-  }}
+  }
+
+  searchInput.addEventListener('focus', ensureIndex, { once: true });
 
   // Debounce para não buscar a cada tecla
   let debounceTimer;
-  searchInput.addEventListener('input', function() {{
+  searchInput.addEventListener('input', function() {
     clearTimeout(debounceTimer);
-    debounceTimer = setTimeout(() => search(this.value.trim()), 150);
-  }});
+    debounceTimer = setTimeout(() => ensureIndex().then(() => search(this.value.trim())), 150);
+  });
 
   // Limpa busca com Escape
-  searchInput.addEventListener('keydown', function(e) {{
-    if (e.key === 'Escape') {{
+  searchInput.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
       this.value = '';
       search('');
-    }}
-  }});
-}})();
-</script>
+    }
+  });
+})();
 """
 
-# JavaScript para busca simples na página de links
-SEARCH_SCRIPT_LINKS = """
-<script>
-(function() {
+# JavaScript para busca simples na página de links (assets/links.<hash>.js)
+SEARCH_JS_LINKS = """(function() {
   // Calcula e exibe "X dias atrás" nas datas
   document.querySelectorAll('.link-meta[data-date]').forEach(meta => {
     const dateStr = meta.dataset.date;
@@ -638,30 +889,224 @@ SEARCH_SCRIPT_LINKS = """
 
   if (!searchInput) return;
 
-  searchInput.addEventListener('input', function() {
-    const query = this.value.toLowerCase().trim();
+  // Texto pesquisável em minúsculas calculado uma vez por item
+  const haystacks = Array.from(items, item => item.dataset.searchable.toLowerCase());
+
+  function filter(value) {
+    const query = value.toLowerCase().trim();
     let visible = 0;
 
-    items.forEach(item => {
-      const text = item.dataset.searchable.toLowerCase();
-      const matches = query === '' || text.includes(query);
+    items.forEach((item, i) => {
+      const matches = query === '' || haystacks[i].includes(query);
       item.classList.toggle('hidden', !matches);
       if (matches) visible++;
     });
 
     if (statsEl) {
-      statsEl.textContent = query ? `${visible} resultado(s) para "${this.value}"` : `${items.length} links`;
+      statsEl.textContent = query ? `${visible} resultado(s) para "${value}"` : `${items.length} links`;
     }
     if (noResults) {
       noResults.classList.toggle('active', visible === 0);
     }
+  }
+
+  // Debounce para não filtrar a cada tecla
+  let debounceTimer;
+  searchInput.addEventListener('input', function() {
+    clearTimeout(debounceTimer);
+    debounceTimer = setTimeout(() => filter(this.value), 100);
   });
 
   if (statsEl) statsEl.textContent = `${items.length} links`;
 })();
-</script>
 """
 
+SEARCH_INDEX_ASSET = hashed_asset("search", "js", rjsmin.jsmin(SEARCH_JS_INDEX))
+SEARCH_LINKS_ASSET = hashed_asset("links", "js", rjsmin.jsmin(SEARCH_JS_LINKS))
+ASSETS = [SITE_CSS_ASSET, SEARCH_INDEX_ASSET, SEARCH_LINKS_ASSET]
+ASSET_FILE_PATTERN = re.compile(r"(?:site|search|links)\.[0-9a-f]{8}\.(?:css|js)")
+
+# Script para calcular delta de dias na página do post (minificado na importação)
+POST_SCRIPT = minify_inline("""
+<script>
+(function() {
+  const weekEl = document.querySelector('.post-week');
+  if (!weekEl) return;
+  const text = weekEl.textContent;
+  const endMatch = text.match(/→\\s*(\\d{2})\\/(\\d{2})\\/(\\d{4})/);
+  if (endMatch) {
+    const endDate = new Date(`${endMatch[3]}-${endMatch[2]}-${endMatch[1]}`);
+    const diffDays = Math.floor((new Date() - endDate) / (1000*60*60*24));
+    if (diffDays >= 0) {
+      const span = document.createElement('span');
+      span.style.color = '#9ca3af';
+      span.textContent = ` (~ ${diffDays} dias atrás)`;
+      weekEl.appendChild(span);
+    }
+  }
+})();
+</script>
+""")
+
+
+# Regexes usadas em todos os posts, compiladas uma única vez
+FILENAME_DATES_PATTERN = re.compile(r"resumo_semana_(\d{4})-(\d{2})-(\d{2})_(\d{4})-(\d{2})-(\d{2})\.md")
+MD_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+SLUG_EXT_PATTERN = re.compile(r'\.[a-z]+$')
+SLUG_SEP_PATTERN = re.compile(r'[-_]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Mensagens do export do WhatsApp (formato BR e internacional). Só o autor
+# é capturado: data, hora e texto são consumidos sem criar substrings.
+# Padrões em bytes: os arquivos de semana são analisados sem decodificar UTF-8.
+# Em bytes, \s só casa espaços ASCII: os espaços Unicode que o `str` aceita
+# (ex.: U+202F antes de "da manhã" nos exports recentes) vão listados em UTF-8
+UNICODE_SPACE_B = rb"(?:[\s\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+MESSAGE_PATTERN = re.compile(
+    rb"\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}(?:" + UNICODE_SPACE_B + rb"(?:da" + UNICODE_SPACE_B + rb")?"
+    + "(?:madrugada|manhã|tarde|noite|meio-dia))? - ([^:]+): .+".encode("utf-8")
+)
+URL_PATTERN = re.compile(rb"https?://(?:(?!" + UNICODE_SPACE_B + rb")\S)+")
+# Tokens do índice invertido de busca (texto já sem acentos)
+SEARCH_TOKEN_PATTERN = re.compile(r'\w+')
+COMBINING_MARKS_PATTERN = re.compile(r'[\u0300-\u036f]')
+WEEK_FILE_PATTERN = re.compile(r"semana_(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})\.txt")
+
+# Elementos de bloco: o texto de cada um é separado do vizinho por espaço
+PLAIN_TEXT_BLOCK_TAGS = frozenset({
+    "p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li",
+    "blockquote", "pre", "table", "tr", "th", "td", "hr", "br",
+})
+# Qualquer título encerra a seção do sumário executivo
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+
+class PlainTextTreeprocessor(Treeprocessor):
+    """Extrai o texto puro e o sumário executivo da árvore já convertida.
+
+    Roda depois dos padrões inline, na mesma conversão que gera o HTML: o
+    resultado fica em `md.plain_text` (texto para busca), `md.summary_text`
+    (texto da seção "Sumário Executivo" até o próximo título de qualquer
+    nível, ou None se ela não existir) e
+    `md.link_refs` (pares [texto, href] dos links `[texto](url)`, na ordem
+    do documento).
+    """
+
+    def run(self, root):
+        plain: list[str] = []
+        summary: list[str] | None = None
+        in_summary = False
+        for element in root:
+            if element.tag in HEADING_TAGS:
+                heading = "".join(element.itertext())
+                in_summary = element.tag == "h2" and heading.startswith("Sumário Executivo")
+                if in_summary:
+                    summary = []
+                    self.collect_text(element, plain)
+                    continue
+            parts: list[str] = []
+            self.collect_text(element, parts)
+            plain.extend(parts)
+            if in_summary:
+                summary.extend(parts)
+
+        self.md.plain_text = WHITESPACE_PATTERN.sub(" ", "".join(plain)).strip()
+        self.md.summary_text = (
+            WHITESPACE_PATTERN.sub(" ", "".join(summary)).strip()
+            if summary is not None else None
+        )
+        inline_links = {id(anchor) for anchor in self.md.inline_links}
+        self.md.link_refs = [
+            [self.unstash("".join(anchor.itertext())), anchor.get("href", "")]
+            for anchor in root.iter("a")
+            if id(anchor) in inline_links
+        ]
+
+    def collect_text(self, element, parts: list[str]) -> None:
+        """Acumula em `parts` o texto de um elemento e de seus filhos, em ordem."""
+        block = element.tag in PLAIN_TEXT_BLOCK_TAGS
+        if block:
+            parts.append(" ")
+        if element.text:
+            text = self.unstash(element.text)
+            # Código inline chega aqui já escapado para HTML
+            parts.append(html.unescape(text) if element.tag == "code" else text)
+        for child in element:
+            self.collect_text(child, parts)
+        if block:
+            parts.append(" ")
+        if element.tail:
+            parts.append(self.unstash(element.tail))
+
+    def unstash(self, text: str) -> str:
+        """Troca os marcadores do stash (blocos de código, HTML bruto,
+        entidades) pelo texto que guardam, sem tags."""
+        def stashed_text(match: re.Match) -> str:
+            raw = self.md.htmlStash.rawHtmlBlocks[int(match.group(1))]
+            return html.unescape(HTML_TAG_PATTERN.sub(" ", raw)) if isinstance(raw, str) else ""
+        return HTML_PLACEHOLDER_RE.sub(stashed_text, text)
+
+
+class InlineLinkProcessor(LinkInlineProcessor):
+    """Links `[texto](url)` que também guardam o elemento em `md.inline_links`.
+
+    Só esses links vão para a página de links: autolinks (`<https://...>`) e
+    links por referência ficam de fora.
+    """
+
+    def handleMatch(self, m, data):
+        el, start, end = super().handleMatch(m, data)
+        if el is not None:
+            self.md.inline_links.append(el)
+        return el, start, end
+
+
+class PlainTextExtension(Extension):
+    """Registra o `PlainTextTreeprocessor` por último (após inline e unescape)."""
+
+    def extendMarkdown(self, md):
+        md.registerExtension(self)
+        self.md = md
+        md.inline_links = []
+        md.inlinePatterns.register(InlineLinkProcessor(LINK_RE, md), "link", 160)
+        md.treeprocessors.register(PlainTextTreeprocessor(md), "plain_text", -10)
+
+    def reset(self):
+        self.md.inline_links = []
+
+
+# Conversor markdown compartilhado por todos os posts: as extensões são
+# carregadas uma vez e `reset()` limpa o estado entre conversões. Além do
+# HTML, a mesma passada produz o texto de busca e o excerpt
+MD_CONVERTER = markdown.Markdown(extensions=["tables", "fenced_code", PlainTextExtension()])
+
+# Versão do gerador: muda sempre que este script (templates, CSS, JS, HTML
+# dos posts) é editado, invalidando as páginas geradas anteriormente
+TEMPLATE_VERSION = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+# Metadados de todos os posts da última geração (usado por --from-cache),
+# gravados em `site_cache_dir`, fora do site publicado
+POSTS_CACHE_FILENAME = "posts.json"
+
+# Versão do cache de conversão markdown (.cache/md): incrementar ao mudar as
+# extensões do MD_CONVERTER ou o PlainTextTreeprocessor
+MD_CACHE_VERSION = 4
+
+# html.escape memoizado para campos que se repetem entre links (domínios,
+# títulos genéricos): poucas dezenas de domínios para centenas de links
+escape_cached = lru_cache(maxsize=4096)(html.escape)
+
+# Escapes do título e da URL dentro do onclick de compartilhar (links.html)
+JS_TITLE_ESCAPES = str.maketrans({"'": "\\'", "(": "\\(", ")": "\\)"})
+JS_URL_ESCAPES = str.maketrans({"'": "\\'", "(": "%28", ")": "%29"})
+
+# Ordinal de 1970-01-01, para datas em "dias desde a época" (como no JS)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Estatísticas de semanas sem arquivo de mensagens
+EMPTY_STATS = {'messages': 0, 'participants': 0, 'links': 0}
+
 
 def extract_dates_from_filename(filename: str) -> tuple[str, str, str, str, str] | None:
     """Extrai datas do nome do arquivo.
@@ -669,8 +1114,7 @@ def extract_dates_from_filename(filename: str) -> tuple[str, str, str, str, str]
     Returns:
         Tuple com (start_display, end_display, slug, start_iso, end_iso) ou None
     """
-    pattern = r"resumo_semana_(\d{4})-(\d{2})-(\d{2})_(\d{4})-(\d{2})-(\d{2})\.md"
-    match = re.match(pattern, filename)
+    match = FILENAME_DATES_PATTERN.match(filename)
     if match:
         start = f"{match.group(3)}/{match.group(2)}/{match.group(1)}"
         end = f"{match.group(6)}/{match.group(5)}/{match.group(4)}"
@@ -681,27 +1125,25 @@ def extract_dates_from_filename(filename: str) -> tuple[str, str, str, str, str]
     return None
 
 
-def extract_excerpt(content: str, max_len: int = 280) -> str:
-    """Extrai o sumário executivo como excerpt com limite de caracteres."""
-    match = re.search(r"## Sumário Executivo[^\n]*\n\n(.+?)(?:\n\n##|\Z)", content, re.DOTALL)
-    if match:
-        excerpt = match.group(1).strip().replace("\n", " ")
+def extract_excerpt(summary: str | None, max_len: int = 280) -> str:
+    """Formata o texto do sumário executivo como excerpt com limite de caracteres."""
+    if summary:
+        excerpt = summary
         if len(excerpt) > max_len:
             excerpt = excerpt[:max_len - 3].rsplit(" ", 1)[0] + "..."
         return excerpt
     return "Resumo semanal do grupo IA + Educação."
 
 
-def extract_links(content: str) -> list[dict]:
-    """Extrai todos os links markdown do conteúdo."""
+def extract_links(link_refs: list[list[str]]) -> list[dict]:
+    """Monta os links do post a partir dos pares [texto, href] da conversão."""
     links = []
-    pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    for match in re.finditer(pattern, content):
-        title = match.group(1).strip()
-        url = match.group(2).strip()
+    for title, url in link_refs:
+        title = title.strip()
+        url = url.strip()
         if url.startswith('http'):
             try:
-                parsed = urlparse(url)
+                parsed = urlsplit(url)
                 domain = parsed.netloc.replace('www.', '')
                 # Se o título é uma URL, tenta criar um título melhor
                 if title.startswith('http') or title == url:
@@ -711,8 +1153,8 @@ def extract_links(content: str) -> list[dict]:
                         # Pega última parte do path e formata
                         slug = path.split('/')[-1]
                         # Remove extensões e parâmetros
-                        slug = re.sub(r'\.[a-z]+$', '', slug)
-                        slug = re.sub(r'[-_]', ' ', slug)
+                        slug = SLUG_EXT_PATTERN.sub('', slug)
+                        slug = SLUG_SEP_PATTERN.sub(' ', slug)
                         if len(slug) > 5:
                             title = f"{domain.split('.')[0].title()} - {slug[:60]}"
                         else:
@@ -729,48 +1171,49 @@ def extract_links(content: str) -> list[dict]:
     return links
 
 
-def clean_text_for_search(text: str) -> str:
-    """Limpa texto para indexação de busca."""
-    # Remove markdown links mantendo o texto
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-    # Remove formatação markdown
-    text = re.sub(r'[*_`#>-]', ' ', text)
-    # Normaliza espaços
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
-
-
-def get_week_stats(semanas_dir: Path, start_date: str, end_date: str) -> dict:
-    """Extrai estatísticas de uma semana.
+def get_week_stats(text: bytes) -> dict:
+    """Extrai estatísticas do texto de uma semana.
 
     Args:
-        semanas_dir: Diretório com arquivos semana_*.txt
-        start_date: Data início no formato YYYY-MM-DD
-        end_date: Data fim no formato YYYY-MM-DD
+        text: Conteúdo (bytes UTF-8, não decodificados) de um arquivo semana_*.txt
 
     Returns:
         dict com: messages, participants, links
     """
-    filename = f"semana_{start_date}_{end_date}.txt"
-    filepath = semanas_dir / filename
+    # Parse mensagens (formato WhatsApp BR e internacional): uma lista de autores
+    authors = MESSAGE_PATTERN.findall(text)
+    # Poucos autores por arquivo: decodificados só para o strip() tirar
+    # também espaços Unicode
+    participants = {author.decode("utf-8", "replace").strip() for author in authors}
+    links = len(URL_PATTERN.findall(text))
 
-    if not filepath.exists():
-        return {'messages': 0, 'participants': 0, 'links': 0}
+    return {
+        'messages': len(authors),
+        'participants': len(participants),
+        'links': links
+    }
 
-    text = filepath.read_text(encoding='utf-8')
 
-    # Parse mensagens (formato WhatsApp BR e internacional)
-    pattern = r"(\d{2}/\d{2}/\d{4}) (\d{1,2}):(\d{2})(?:\s(?:da\s)?(madrugada|manhã|tarde|noite|meio-dia))? - ([^:]+): (.+)"
-    messages = re.findall(pattern, text)
+def load_all_stats(semanas_dir: Path) -> dict[tuple[str, str], dict]:
+    """Calcula as estatísticas de todas as semanas numa única passada.
 
-    authors = set(m[4].strip() for m in messages)
-    links = len(re.findall(r'https?://\S+', text))
+    Cada arquivo semana_*.txt é lido e analisado uma vez só.
 
-    return {
-        'messages': len(messages),
-        'participants': len(authors),
-        'links': links
-    }
+    Args:
+        semanas_dir: Diretório com arquivos semana_*.txt
+
+    Returns:
+        dict (start_iso, end_iso) -> estatísticas de `get_week_stats`
+    """
+    stats_map = {}
+    if not semanas_dir.is_dir():
+        return stats_map
+    for filepath in sorted(semanas_dir.glob("semana_*.txt")):
+        match = WEEK_FILE_PATTERN.fullmatch(filepath.name)
+        if match:
+            text = filepath.read_bytes()
+            stats_map[(match.group(1), match.group(2))] = get_week_stats(text)
+    return stats_map
 
 
 def get_month_name(month: str) -> str:
@@ -783,33 +1226,192 @@ def get_month_name(month: str) -> str:
     return months.get(month, month)
 
 
-def build_post(md_path: Path, output_dir: Path, base_url: str) -> dict | None:
-    """Converte um markdown em HTML e retorna metadados."""
+def site_cache_dir(cache_dir: Path, output_dir: Path) -> Path:
+    """Diretório do estado de build de um diretório de saída.
+
+    Fica no cache, fora do site publicado (que vai inteiro para o
+    repositório do Pages); um subdiretório por saída, identificado pelo
+    caminho absoluto.
+    """
+    key = hashlib.sha1(str(output_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / "site" / key
+
+
+def post_meta_path(meta_dir: Path, slug: str) -> Path:
+    """Caminho do sidecar com os metadados de um post gerado."""
+    return meta_dir / f"{slug}.meta.json"
+
+
+def post_build_key(base_url: str, year: int) -> dict:
+    """Chave de build gravada no sidecar de cada post.
+
+    Reúne tudo o que muda o HTML de um post sem mudar o markdown: versão do
+    gerador, versão do markdown, nomes dos assets (o hash depende da saída
+    do rcssmin/rjsmin instalado), base_url e ano do rodapé.
+    """
+    return {
+        "version": TEMPLATE_VERSION,
+        "markdown": markdown.__version__,
+        "assets": [name for name, _ in ASSETS],
+        "base_url": base_url,
+        "year": year,
+    }
+
+
+def load_post_meta(md_path: Path, output_path: Path, meta_path: Path, build_key: dict) -> dict | None:
+    """Retorna os metadados salvos se o HTML do post ainda estiver atualizado.
+
+    O post é considerado atualizado quando o HTML existe, o sidecar é mais
+    novo que o markdown e foi gravado com a mesma chave de build (ver
+    `post_build_key`). O mtime é o do sidecar, sempre
+    regravado: o HTML só é regravado quando o conteúdo muda.
+    """
+    try:
+        if not output_path.exists() or meta_path.stat().st_mtime_ns < md_path.stat().st_mtime_ns:
+            return None
+        meta = loads_json(meta_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("build_key") != build_key:
+        return None
+    return meta.get("post")
+
+
+def load_fresh_post(
+    md_path: Path, output_dir: Path, meta_dir: Path, base_url: str, year: int
+) -> dict | None:
+    """Metadados de um post cujo HTML ainda está atualizado, ou None.
+
+    Usa só o nome do arquivo, `stat` e o sidecar: o markdown não é aberto.
+    """
+    dates = extract_dates_from_filename(md_path.name)
+    if not dates:
+        return None
+    slug = dates[2]
+    return load_post_meta(
+        md_path,
+        output_dir / f"{slug}.html",
+        post_meta_path(meta_dir, slug),
+        post_build_key(base_url, year),
+    )
+
+
+def write_raw(path: Path, data: bytes) -> None:
+    """Grava bytes direto no descritor de arquivo.
+
+    Evita a camada de buffers de `Path.write_bytes`/`write_text`: em geral,
+    uma única chamada `os.write` por arquivo.
+    """
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_utf8(path: Path, text: str) -> None:
+    """Grava texto em UTF-8 com `write_raw` (um único encode)."""
+    write_raw(path, text.encode("utf-8"))
+
+
+def write_if_changed(path: Path, data: str | bytes) -> bool:
+    """Grava o arquivo só se o conteúdo for diferente do atual.
+
+    Arquivos idênticos não são tocados: sem escrita em disco e sem mudar o
+    mtime (que ferramentas de deploy e sincronização usam como cache).
+
+    Returns:
+        True se o arquivo foi gravado
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    write_raw(path, data)
+    return True
+
+
+def convert_markdown(body: str, cache_dir: Path | None = None) -> dict:
+    """Converte markdown com o MD_CONVERTER, reaproveitando conversões anteriores.
+
+    O resultado fica em `cache_dir/md/<sha256 do conteúdo>.json`: a conversão
+    é determinística, então o mesmo markdown sempre gera o mesmo HTML, mesmo
+    depois de mudanças no template que invalidam as páginas.
+
+    Returns:
+        dict com: html, plain (texto puro para busca), summary (texto do
+        sumário executivo ou None), links (pares [texto, href])
+    """
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(
+            f"{MD_CACHE_VERSION}\0{markdown.__version__}\0{body}".encode("utf-8")
+        ).hexdigest()[:16]
+        cache_path = cache_dir / "md" / f"{key}.json"
+        try:
+            return loads_json(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+    converted = {
+        "html": MD_CONVERTER.reset().convert(body),
+        "plain": MD_CONVERTER.plain_text,
+        "summary": MD_CONVERTER.summary_text,
+        "links": MD_CONVERTER.link_refs,
+    }
+    if cache_path is not None:
+        write_raw(cache_path, dumps_json(converted))
+    return converted
+
+
+def build_post(
+    md_path: Path,
+    output_dir: Path,
+    meta_dir: Path,
+    base_url: str,
+    year: int,
+    cache_dir: Path | None = None,
+) -> dict | None:
+    """Converte um markdown em HTML e retorna metadados.
+
+    Os metadados também são gravados num sidecar em `meta_dir` (ver
+    `site_cache_dir`), para que `load_fresh_post` possa pular o post nas
+    próximas gerações enquanto ele não mudar.
+    """
     dates = extract_dates_from_filename(md_path.name)
     if not dates:
         print(f"Aviso: Ignorando {md_path.name}", file=sys.stderr)
         return None
 
     week_start, week_end, slug, start_iso, end_iso = dates
-    content = md_path.read_text(encoding="utf-8")
 
-    links = extract_links(content)
+    output_path = output_dir / f"{slug}.html"
+    meta_path = post_meta_path(meta_dir, slug)
+    build_key = post_build_key(base_url, year)
+
+    content = md_path.read_text(encoding="utf-8")
 
     # Remove cabeçalho original
     lines = content.split("\n")
     start_idx = next((i for i, line in enumerate(lines) if line.startswith("## Sumário")), 0)
     clean_content = "\n".join(lines[start_idx:])
 
-    # Converte markdown para HTML
-    md = markdown.Markdown(extensions=["tables", "fenced_code"])
-    html_content = md.convert(clean_content)
+    # Converte markdown para HTML (texto de busca, sumário e links vêm da
+    # mesma conversão, ou do cache por conteúdo)
+    converted = convert_markdown(clean_content, cache_dir)
+    html_content = converted["html"]
+    search_content = converted["plain"]
+    summary_text = converted["summary"]
+    links = extract_links(converted["links"])
 
     # Metadados
     title = "Resumo Semanal"
-    excerpt = extract_excerpt(content)
-
-    # Texto limpo para busca (conteúdo completo)
-    search_content = clean_text_for_search(clean_content)
+    excerpt = extract_excerpt(summary_text)
 
     post_content = f"""
     <a href="{base_url}index.html" class="back-link">Voltar aos resumos</a>
@@ -826,41 +1428,18 @@ def build_post(md_path: Path, output_dir: Path, base_url: str) -> dict | None:
     </article>
     """
 
-    # Script para calcular delta de dias na página do post
-    post_script = """
-<script>
-(function() {
-  const weekEl = document.querySelector('.post-week');
-  if (!weekEl) return;
-  const text = weekEl.textContent;
-  const endMatch = text.match(/→\\s*(\\d{2})\\/(\\d{2})\\/(\\d{4})/);
-  if (endMatch) {
-    const endDate = new Date(`${endMatch[3]}-${endMatch[2]}-${endMatch[1]}`);
-    const diffDays = Math.floor((new Date() - endDate) / (1000*60*60*24));
-    if (diffDays >= 0) {
-      const span = document.createElement('span');
-      span.style.color = '#9ca3af';
-      span.textContent = ` (~ ${diffDays} dias atrás)`;
-      weekEl.appendChild(span);
-    }
-  }
-})();
-</script>
-"""
-
-    page_html = BASE_TEMPLATE.format(
+    page_html = render_base(
         title=title,
         description=excerpt,
         base_url=base_url,
         content=post_content,
-        year=datetime.now().year,
-        scripts=post_script
+        year=year,
+        scripts=POST_SCRIPT
     )
 
-    output_path = output_dir / f"{slug}.html"
-    output_path.write_text(page_html, encoding="utf-8")
+    changed = write_if_changed(output_path, page_html)
 
-    return {
+    post = {
         "title": title,
         "slug": slug,
         "week_start": week_start,
@@ -872,39 +1451,143 @@ def build_post(md_path: Path, output_dir: Path, base_url: str) -> dict | None:
         "links": links,
         "search_content": search_content,
     }
+    write_raw(meta_path, dumps_json({"build_key": build_key, "post": post}))
+    # "changed" só acompanha o retorno (não vai para o sidecar)
+    return {**post, "changed": changed}
+
+
+def fold_search_text(text: str) -> str:
+    """Normaliza texto para busca: minúsculas e sem acentos.
+
+    Espelha a função `fold` do script de busca no navegador.
+    """
+    return COMBINING_MARKS_PATTERN.sub('', unicodedata.normalize('NFKD', text.lower()))
+
+
+def build_postings(texts: list[str]) -> dict:
+    """Monta o índice invertido token -> documentos.
+
+    No navegador ele só pré-filtra os documentos candidatos; a busca em si
+    continua sendo por substring no texto (ver `search` em SEARCH_JS_INDEX).
+
+    Returns:
+        dict com "v" (vocabulário ordenado) e "p" (para cada token, lista
+        dos doc_ids que o contêm)
+    """
+    postings: dict[str, list[int]] = {}
+    for doc_id, text in enumerate(texts):
+        for token in set(SEARCH_TOKEN_PATTERN.findall(fold_search_text(text))):
+            postings.setdefault(token, []).append(doc_id)
+
+    vocab = sorted(postings)
+    return {"v": vocab, "p": [postings[token] for token in vocab]}
+
+
+def write_search_json(path: Path, data) -> bytes:
+    """Grava um índice de busca em JSON compacto e também em `.json.gz`.
+
+    O navegador baixa a versão gzip (texto + JSON comprime 4-8x) e
+    descomprime com DecompressionStream; o JSON puro fica como fallback.
+
+    Returns:
+        O JSON gravado, em bytes
+    """
+    payload = dumps_json(data)
+    write_if_changed(path, payload)
+    # mtime=0: mesmo conteúdo gera o mesmo .gz (builds reprodutíveis)
+    write_if_changed(path.with_name(path.name + ".gz"), gzip.compress(payload, compresslevel=9, mtime=0))
+    return payload
+
+
+def write_assets(output_dir: Path, prune: bool = True) -> list[str]:
+    """Grava CSS e JS do site em assets/ e remove versões antigas com outro hash.
+
+    Com `prune=False` as versões antigas são mantidas: usado com --from-cache,
+    em que as páginas dos posts não são regeradas e podem ainda apontar para
+    elas. O diretório assets/ já deve existir (criado em `main`).
+    """
+    assets_dir = output_dir / "assets"
+    current = {name for name, _ in ASSETS}
+    if prune:
+        for old in assets_dir.iterdir():
+            if ASSET_FILE_PATTERN.fullmatch(old.name) and old.name not in current:
+                old.unlink()
+    for name, content in ASSETS:
+        path = assets_dir / name
+        if not path.exists():
+            write_utf8(path, content)
+    return sorted(current)
+
+
+def build_search_index(posts: list[dict], output_dir: Path) -> str:
+    """Gera os índices JSON para busca.
+
+    search-index.json tem os documentos em formato colunar, com JSON
+    compacto para reduzir o download: "k" lista as chaves uma única vez e
+    "r" traz uma lista de valores por documento, na mesma ordem. Chaves:
+    t = título, s = slug (a URL é montada no navegador com o base_url),
+    w = semana, e = fim da semana em dias desde 1970-01-01, c = conteúdo.
+    Só os campos usados pela busca são enviados.
+    search-postings.json tem o índice invertido (ver `build_postings`), que
+    limita a busca por substring aos documentos candidatos.
+
+    Returns:
+        Hash dos índices gerados, usado pelo navegador para invalidar a
+        cópia guardada no localStorage
+    """
+    index = {
+        "k": ["t", "s", "w", "e", "c"],
+        "r": [
+            [
+                post["title"],
+                post["slug"],
+                f"{post['week_start']} → {post['week_end']}",
+                date.fromisoformat(post["end_iso"]).toordinal() - EPOCH_ORDINAL,
+                post["search_content"],
+            ]
+            for post in posts
+        ],
+    }
 
+    build_hash = hashlib.sha1()
+    build_hash.update(write_search_json(output_dir / "search-index.json", index))
 
-def build_search_index(posts: list[dict], output_dir: Path, base_url: str) -> None:
-    """Gera o índice JSON para busca."""
-    index = []
-    for post in posts:
-        index.append({
-            "title": post["title"],
-            "url": f"{base_url}{post['slug']}.html",
-            "week": f"{post['week_start']} → {post['week_end']}",
-            "content": post["search_content"],
-        })
+    postings = build_postings([post["search_content"] for post in posts])
+    build_hash.update(write_search_json(output_dir / "search-postings.json", postings))
+    return build_hash.hexdigest()[:12]
 
-    index_path = output_dir / "search-index.json"
-    index_path.write_text(json.dumps(index, ensure_ascii=False, indent=None), encoding="utf-8")
 
+def build_index(
+    posts: list[dict],
+    output_dir: Path,
+    base_url: str,
+    stats_map: dict[tuple[str, str], dict],
+    index_hash: str,
+    year: int,
+) -> bool:
+    """Gera a página índice.
 
-def build_index(posts: list[dict], output_dir: Path, base_url: str, semanas_dir: Path) -> None:
-    """Gera a página índice."""
-    posts = sorted(posts, key=lambda p: p["date"], reverse=True)
+    Args:
+        posts: Posts processados, do mais recente para o mais antigo
+        output_dir: Diretório de saída
+        base_url: URL base do site
+        stats_map: Estatísticas por semana, de `load_all_stats`
+        index_hash: Hash dos índices de busca, de `build_search_index`
+        year: Ano do rodapé, calculado uma vez por build
 
-    cards_html = ""
+    Returns:
+        True se o index.html mudou
+    """
+    card_parts = []
     for idx, post in enumerate(posts):
-        share_url = f"{base_url}{post['slug']}.html"
         title_js = post['title'].replace("'", "\\'")
-        # Converte data DD/MM/YYYY para YYYY-MM-DD para JavaScript
-        end_parts = post['week_end'].split('/')
-        end_date_iso = f"{end_parts[2]}-{end_parts[1]}-{end_parts[0]}"
+        # Data YYYY-MM-DD para JavaScript (já extraída do nome do arquivo)
+        end_date_iso = post['end_iso']
         # Badge "NEW" apenas no card mais recente
         badge_html = '<span class="badge-new">NEW</span>' if idx == 0 else ''
         # Estatísticas da semana
-        stats = get_week_stats(semanas_dir, post['start_iso'], post['end_iso'])
-        cards_html += f"""
+        stats = stats_map.get((post['start_iso'], post['end_iso']), EMPTY_STATS)
+        card_parts.append(f"""
         <div class="post-card">
           {badge_html}
           <div class="post-card-header">
@@ -923,7 +1606,8 @@ def build_index(posts: list[dict], output_dir: Path, base_url: str, semanas_dir:
           <hr class="post-card-divider">
           <div class="post-card-footer" data-end-date="{end_date_iso}">{post['week_start']} → {post['week_end']}</div>
         </div>
-        """
+        """)
+    cards_html = "".join(card_parts)
 
     index_content = f"""
     <header class="page-header">
@@ -932,7 +1616,7 @@ def build_index(posts: list[dict], output_dir: Path, base_url: str, semanas_dir:
     </header>
     <div class="search-container">
       <input type="text" id="searchInput" class="search-input" placeholder="Buscar em todos os resumos... (ex: Educação, NotebookLM, Matemática)">
-      <div id="searchStats" class="search-stats">Carregando índice...</div>
+      <div id="searchStats" class="search-stats">{len(posts)} resumos disponíveis para busca</div>
     </div>
     <div id="searchResults" class="search-results"></div>
     <div id="noResults" class="no-results">Nenhum resultado encontrado. Tente outros termos.</div>
@@ -941,16 +1625,19 @@ def build_index(posts: list[dict], output_dir: Path, base_url: str, semanas_dir:
     </div>
     """
 
-    page_html = BASE_TEMPLATE.format(
+    page_html = render_base(
         title="Resumos Semanais",
         description="Resumos semanais do grupo WhatsApp sobre IA e Educação",
         base_url=base_url,
         content=index_content,
-        year=datetime.now().year,
-        scripts=SEARCH_SCRIPT_INDEX.format(base_url=base_url)
+        year=year,
+        scripts=(
+            f'<script src="{base_url}assets/{SEARCH_INDEX_ASSET[0]}" '
+            f'data-base-url="{html.escape(base_url)}" data-index-hash="{index_hash}"></script>'
+        )
     )
 
-    (output_dir / "index.html").write_text(page_html, encoding="utf-8")
+    return write_if_changed(output_dir / "index.html", page_html)
 
 
 def load_links_from_json(path: Path) -> list[dict]:
@@ -959,49 +1646,50 @@ def load_links_from_json(path: Path) -> list[dict]:
         print(f"Aviso: {path} não encontrado", file=sys.stderr)
         return []
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = loads_json(path.read_bytes())
 
-    # Normaliza formato para o esperado pelo build_links_page
-    links = []
+    # Normaliza formato para o esperado pelo build_links_page, alterando os
+    # próprios dicts carregados (sem uma segunda cópia da lista)
     for item in data:
-        links.append({
-            "url": item["url"],
-            "title": item.get("title", item["domain"]),
-            "domain": item["domain"],
-            "week": item.get("date", ""),  # data no formato DD/MM/YYYY
-            "shared_by": item.get("shared_by", ""),
-        })
-    return links
+        item["week"] = item.pop("date", "")  # data no formato DD/MM/YYYY
+        item.setdefault("title", item["domain"])
+        item.setdefault("shared_by", "")
+    return data
 
 
 def build_links_page(
     posts: list[dict],
     output_dir: Path,
     base_url: str,
+    year: int,
     links_source: str = "resumos",
     links_json_path: Path | None = None,
-) -> int:
+) -> tuple[int, bool]:
     """Gera a página de links.
 
     Args:
-        posts: Lista de posts processados
+        posts: Posts processados, do mais recente para o mais antigo
         output_dir: Diretório de saída
         base_url: URL base do site
+        year: Ano do rodapé, calculado uma vez por build
         links_source: Fonte dos links - "resumos", "full" ou "both"
         links_json_path: Caminho para o JSON de links (usado com "full" ou "both")
+
+    Returns:
+        Tuple com (total de links, True se o links.html mudou)
     """
-    links_by_domain: dict[str, list[dict]] = defaultdict(list)
+    all_links: list[dict] = []
     seen_urls = set()
 
     # Carrega links dos resumos (fonte original)
     if links_source in ("resumos", "both"):
-        for post in sorted(posts, key=lambda p: p["date"], reverse=True):
+        for post in posts:
             for link in post.get("links", []):
                 if link["url"] not in seen_urls:
                     seen_urls.add(link["url"])
                     link["week"] = post["week_end"]
                     link["post_slug"] = post["slug"]
-                    links_by_domain[link["domain"]].append(link)
+                    all_links.append(link)
 
     # Carrega links do JSON completo
     if links_source in ("full", "both"):
@@ -1010,44 +1698,39 @@ def build_links_page(
         for link in external_links:
             if link["url"] not in seen_urls:
                 seen_urls.add(link["url"])
-                links_by_domain[link["domain"]].append(link)
-
-    # Flatten all links into a single list sorted by date (most recent first)
-    all_links = []
-    for domain, links in links_by_domain.items():
-        all_links.extend(links)
+                all_links.append(link)
 
     # Sort by week date (DD/MM/YYYY format) - most recent first
     def parse_date(week_str):
-        try:
-            parts = week_str.split('/')
-            if len(parts) == 3:
-                return f"{parts[2]}-{parts[1]}-{parts[0]}"  # YYYY-MM-DD for sorting
-        except:
-            pass
+        # Formato fixo de 10 caracteres: fatias, sem split nem lista
+        if len(week_str) == 10 and week_str[2] == '/' and week_str[5] == '/':
+            return week_str[6:10] + '-' + week_str[3:5] + '-' + week_str[0:2]  # YYYY-MM-DD for sorting
         return "0000-00-00"
 
-    all_links.sort(key=lambda x: parse_date(x.get('week', '')), reverse=True)
+    # Data ISO calculada uma vez por link: serve de chave de ordenação e
+    # para o data-date do JavaScript
+    for link in all_links:
+        link['_iso'] = parse_date(link.get('week') or '')
+    all_links.sort(key=itemgetter('_iso'), reverse=True)
     total_links = len(all_links)
 
-    # Build Hacker News style list
-    links_html = ""
-    for idx, link in enumerate(all_links, 1):
-        title_safe = html.escape(link["title"])
-        title_js = html.escape(link["title"]).replace("'", "\\'").replace("(", "\\(").replace(")", "\\)")
-        url_js = link["url"].replace("'", "\\'").replace("(", "%28").replace(")", "%29")
-        searchable = f"{link['title']} {link['domain']} {link.get('week', '')}"
-        week_display = link.get('week', '')
-        # Convert DD/MM/YYYY to ISO for JavaScript
-        date_iso = parse_date(week_display) if week_display else ''
-
-        links_html += f"""
+    # Build Hacker News style list (um pedaço de HTML por link, sob demanda)
+    def link_items():
+        for idx, link in enumerate(all_links, 1):
+            title_safe = escape_cached(link["title"])
+            title_js = title_safe.translate(JS_TITLE_ESCAPES)
+            url_js = link["url"].translate(JS_URL_ESCAPES)
+            searchable = f"{link['title']} {link['domain']} {link.get('week', '')}"
+            week_display = link.get('week', '')
+            date_iso = link['_iso']
+
+            yield f"""
         <div class="link-item" data-searchable="{html.escape(searchable)}">
           <span class="link-rank">{idx}.</span>
           <div class="link-content">
             <a href="{link['url']}" class="link-title" target="_blank" rel="noopener">{title_safe}</a>
             <div class="link-meta"{f' data-date="{date_iso}"' if date_iso and date_iso != '0000-00-00' else ''}>
-              <span class="link-domain">({link['domain']})</span>
+              <span class="link-domain">({escape_cached(link['domain'])})</span>
               <span class="link-date">{f' | {week_display}' if week_display else ''}</span>
               <span class="link-share" onclick="window.open('https://wa.me/?text=' + encodeURIComponent('{title_js} {url_js}'), '_blank')" title="Compartilhar via WhatsApp">| compartilhar</span>
             </div>
@@ -1055,7 +1738,7 @@ def build_links_page(
         </div>
         """
 
-    links_content = f"""
+    links_header = f"""
     <header class="page-header">
       <h1 class="page-title">REPOSITÓRIO_DE_LINKS</h1>
       <p class="page-subtitle">Links compartilhados no grupo // ordenados por data</p>
@@ -1066,22 +1749,88 @@ def build_links_page(
     </div>
     <p class="links-count">{total_links} links</p>
     <div class="links-list">
-      {links_html}
+      """
+    links_footer = """
     </div>
     <div id="noResults" class="no-results">Nenhum link encontrado</div>
     """
 
-    page_html = BASE_TEMPLATE.format(
+    # A página é escrita pedaço a pedaço num único buffer, sem montar a
+    # lista de links e o conteúdo como strings intermediárias
+    buffer = io.StringIO()
+    write_base(
+        buffer,
+        chain((links_header,), link_items(), (links_footer,)),
         title="Repositório de Links",
         description="Links sobre IA e Educação compartilhados no grupo",
         base_url=base_url,
-        content=links_content,
-        year=datetime.now().year,
-        scripts=SEARCH_SCRIPT_LINKS
+        year=year,
+        scripts=f'<script src="{base_url}assets/{SEARCH_LINKS_ASSET[0]}"></script>'
+    )
+
+    changed = write_if_changed(output_dir / "links.html", buffer.getvalue())
+    return total_links, changed
+
+
+def render_posts(
+    md_files: list[Path],
+    output_dir: Path,
+    base_url: str,
+    year: int,
+    cache_dir: Path,
+    workers: int,
+) -> tuple[list[dict], int]:
+    """Gera as páginas dos posts, reconvertendo só os que mudaram.
+
+    Returns:
+        Tuple com (metadados dos posts, na ordem de `md_files`, número de
+        páginas de post regravadas)
+    """
+    # Posts sem mudança (sidecar mais novo que o markdown e gravado por esta
+    # versão do script) são resolvidos aqui, só com stat + sidecar
+    meta_dir = site_cache_dir(cache_dir, output_dir)
+    results: dict[Path, dict | None] = {}
+    stale = []
+    for md_path in md_files:
+        post = load_fresh_post(md_path, output_dir, meta_dir, base_url, year)
+        if post is None:
+            stale.append(md_path)
+        else:
+            results[md_path] = post
+
+    # Cada post é independente e a conversão markdown é CPU-bound: processos
+    # (cada um com seu MD_CONVERTER) escalam com o número de núcleos
+    render = partial(
+        build_post,
+        output_dir=output_dir,
+        meta_dir=meta_dir,
+        base_url=base_url,
+        year=year,
+        cache_dir=cache_dir,
     )
+    workers = max(1, min(workers, len(stale)))
+    if workers > 1:
+        # Lotes de alguns posts por tarefa: menos idas e voltas entre processos
+        # em históricos longos, ainda com ~4 lotes por processo para balancear
+        chunksize = max(1, len(stale) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = list(executor.map(render, stale, chunksize=chunksize))
+    else:
+        rendered = [render(md_path) for md_path in stale]
+    changed_pages = 0
+    for md_path, post in zip(stale, rendered):
+        results[md_path] = post
+        if post:
+            if post.pop("changed"):
+                changed_pages += 1
+                print(f"Gerado: {post['slug']}.html")
+            else:
+                print(f"Sem mudanças: {post['slug']}.html")
+    if len(stale) < len(md_files):
+        print(f"{len(md_files) - len(stale)} posts sem mudanças")
 
-    (output_dir / "links.html").write_text(page_html, encoding="utf-8")
-    return total_links
+    posts = [post for md_path in md_files if (post := results[md_path])]
+    return posts, changed_pages
 
 
 def main() -> int:
@@ -1090,6 +1839,17 @@ def main() -> int:
     parser.add_argument("--output_dir", type=Path, default=Path("docs"))
     parser.add_argument("--base_url", default="")
     parser.add_argument("--clean", action="store_true")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(".cache"),
+        help="Diretório do cache: conversões markdown (por hash do conteúdo) e metadados dos posts gerados",
+    )
+    parser.add_argument(
+        "--clean-cache",
+        action="store_true",
+        help="Apaga o cache antes de gerar o site (todos os posts são regerados)",
+    )
     parser.add_argument(
         "--links-source",
         choices=["resumos", "full", "both"],
@@ -1102,6 +1862,17 @@ def main() -> int:
         default=Path("links/links.json"),
         help="Caminho para o JSON de links (usado com --links-source full ou both)",
     )
+    parser.add_argument(
+        "--from-cache",
+        action="store_true",
+        help="Reusa os posts da última geração (guardados em --cache-dir) e regera só índice, busca e links",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processos para converter os resumos em paralelo (default: nº de CPUs)",
+    )
     args = parser.parse_args()
 
     if not args.input_dir.exists():
@@ -1111,37 +1882,80 @@ def main() -> int:
     if args.clean and args.output_dir.exists():
         shutil.rmtree(args.output_dir)
 
-    args.output_dir.mkdir(parents=True, exist_ok=True)
-
-    md_files = sorted(args.input_dir.glob("resumo_semana_*.md"))
-    if not md_files:
-        print(f"Nenhum resumo em {args.input_dir}", file=sys.stderr)
-        return 1
-
-    posts = []
-    for md_path in md_files:
-        post = build_post(md_path, args.output_dir, args.base_url)
-        if post:
-            posts.append(post)
-            print(f"Gerado: {post['slug']}.html")
-
-    build_search_index(posts, args.output_dir, args.base_url)
-    print("Gerado: search-index.json")
+    if args.clean_cache and args.cache_dir.exists():
+        shutil.rmtree(args.cache_dir)
+
+    # Todos os diretórios de saída são criados uma vez aqui; as funções de
+    # geração (inclusive nos processos) só gravam arquivos
+    for directory in (
+        args.output_dir / "assets",
+        args.cache_dir / "md",
+        site_cache_dir(args.cache_dir, args.output_dir),
+    ):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    year = datetime.now().year
+    posts_cache = site_cache_dir(args.cache_dir, args.output_dir) / POSTS_CACHE_FILENAME
+    if args.from_cache:
+        # Reaproveita os metadados da última geração: nenhum markdown é lido
+        try:
+            posts = loads_json(posts_cache.read_bytes())
+        except (OSError, ValueError) as e:
+            print(f"Erro: não foi possível ler {posts_cache}: {e}", file=sys.stderr)
+            return 1
+        changed_pages = 0
+        print(f"{len(posts)} posts lidos de {posts_cache}")
+    else:
+        # scandir lista o diretório numa passada (o tipo vem da própria
+        # entrada); ordenar pelo nome = ordem cronológica
+        with os.scandir(args.input_dir) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.startswith("resumo_semana_")
+                and entry.name.endswith(".md")
+                and entry.is_file()
+            )
+        md_files = [args.input_dir / name for name in names]
+        if not md_files:
+            print(f"Nenhum resumo em {args.input_dir}", file=sys.stderr)
+            return 1
+        posts, changed_pages = render_posts(
+            md_files, args.output_dir, args.base_url, year, args.cache_dir, args.workers
+        )
+        write_if_changed(posts_cache, dumps_json(posts))
+
+    # Posts só são regerados fora do --from-cache; sem isso, versões antigas
+    # dos assets ainda referenciadas por eles não podem ser apagadas
+    asset_names = write_assets(args.output_dir, prune=not args.from_cache)
+    print(f"Gerado: assets/ ({', '.join(asset_names)})")
+
+    index_hash = build_search_index(posts, args.output_dir)
+    print("Gerado: search-index.json, search-postings.json")
 
     semanas_dir = args.input_dir.parent / "semanas"
-    build_index(posts, args.output_dir, args.base_url, semanas_dir)
+    stats_map = load_all_stats(semanas_dir)
+    # Índice e links listam os posts do mais recente para o mais antigo:
+    # ordenados uma única vez aqui
+    posts_by_date = sorted(posts, key=itemgetter("date"), reverse=True)
+    if build_index(posts_by_date, args.output_dir, args.base_url, stats_map, index_hash, year):
+        changed_pages += 1
     print("Gerado: index.html")
 
-    total_links = build_links_page(
-        posts,
+    total_links, links_changed = build_links_page(
+        posts_by_date,
         args.output_dir,
         args.base_url,
+        year,
         links_source=args.links_source,
         links_json_path=args.links_json,
     )
+    changed_pages += links_changed
     print(f"Gerado: links.html ({total_links} links, fonte: {args.links_source})")
 
-    print(f"\n{len(posts) + 2} páginas + índice em {args.output_dir}/")
+    total_pages = len(posts) + 2
+    print(f"\n{total_pages} páginas + índice em {args.output_dir}/")
+    print(f"{changed_pages} alteradas / {total_pages - changed_pages} sem mudanças")
     return 0
 
 
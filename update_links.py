@@ -28,7 +28,7 @@ import sys
 import time
 from collections.abc import Iterator
 from pathlib import Path
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
@@ -41,43 +41,54 @@ MESSAGE_PATTERN = re.compile(
     re.MULTILINE
 )
 
-# Parâmetros de tracking a remover
-TRACKING_PARAMS = {
+# Parâmetros de tracking a remover (em minúsculas: a busca usa a chave normalizada)
+TRACKING_PARAMS = frozenset({
     'utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term',
     'fbclid', 'igsh', 'igshid', 'gclid', 'gclsrc',
     'ref', 'rcm', 'source', 'mc_cid', 'mc_eid',
-    'trk', 'lipi', 'licu', 'tag', 'linkCode', 'linkId',
+    'trk', 'lipi', 'licu', 'tag', 'linkcode', 'linkid',
     'share', 'si',
-}
+})
 
 ESSENTIAL_PARAMS = {
-    'youtube.com': {'v', 't', 'list', 'index'},
-    'youtu.be': {'t'},
-    'docs.google.com': {},
+    'youtube.com': frozenset({'v', 't', 'list', 'index'}),
+    'youtu.be': frozenset({'t'}),
+    'docs.google.com': frozenset(),
 }
 
+# Sufixos ordenados do mais longo para o mais curto: o mais específico vence
+ESSENTIAL_SUFFIXES = sorted(ESSENTIAL_PARAMS.items(), key=lambda kv: -len(kv[0]))
+
+
+def essential_params(domain: str) -> frozenset[str]:
+    """Parâmetros essenciais do domínio ou de um domínio pai (ex.: m.youtube.com)."""
+    return next(
+        (params for suffix, params in ESSENTIAL_SUFFIXES
+         if domain == suffix or domain.endswith('.' + suffix)),
+        frozenset(),
+    )
+
 
 def clean_url(url: str) -> str:
     """Remove parâmetros de tracking da URL."""
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         domain = parsed.netloc.replace('www.', '').lower()
-        essential = ESSENTIAL_PARAMS.get(domain, set())
+        essential = essential_params(domain)
 
         if parsed.query:
-            params = parse_qs(parsed.query, keep_blank_values=True)
-            filtered = {k: v for k, v in params.items()
-                       if k.lower() not in TRACKING_PARAMS or k.lower() in essential}
-            new_query = urlencode(filtered, doseq=True) if filtered else ''
+            filtered = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                        if (key := k.lower()) not in TRACKING_PARAMS or key in essential]
+            new_query = urlencode(filtered) if filtered else ''
         else:
             new_query = ''
 
         fragment = parsed.fragment if parsed.fragment and not parsed.fragment.startswith('~') else ''
 
-        return urlunparse((
+        return urlunsplit((
             parsed.scheme, parsed.netloc,
             parsed.path.rstrip('/') if parsed.path != '/' else parsed.path,
-            parsed.params, new_query, fragment
+            new_query, fragment
         ))
     except Exception:
         return url
@@ -86,7 +97,7 @@ def clean_url(url: str) -> str:
 def extract_domain(url: str) -> str:
     """Extrai o domínio principal da URL."""
     try:
-        return urlparse(url).netloc.replace('www.', '').lower()
+        return urlsplit(url).netloc.replace('www.', '').lower()
     except Exception:
         return 'unknown'
 
@@ -94,7 +105,7 @@ def extract_domain(url: str) -> str:
 def generate_title(url: str, domain: str) -> str:
     """Gera um título legível a partir da URL."""
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         path = parsed.path.strip('/')
 
         if 'linkedin.com' in domain: